@@ -25,14 +25,14 @@ def get_uncensored_reasoning(query: str, context: Dict[str, Any] = None) -> Dict
     # Format context
     formatted_context = ""
     if context:
-        formatted_context = "\n\nContext:\n"
+        formatted_parts = ["\n\nContext:"]
         for key, value in context.items():
             if key == "relevant_memories" and isinstance(value, list):
-                formatted_context += "Relevant Memories:\n"
-                for i, memory in enumerate(value, 1):
-                    formatted_context += f"  {i}. {memory}\n"
+                formatted_parts.append("Relevant Memories:")
+                formatted_parts.extend(f"  {i}. {memory}" for i, memory in enumerate(value, 1))
             else:
-                formatted_context += f"{key.replace('_', ' ').title()}: {value}\n"
+                formatted_parts.append(f"{key.replace('_', ' ').title()}: {value}")
+        formatted_context = "\n".join(formatted_parts) + "\n"
     
     # Get the local LM Studio URL from config
     from config.config_manager import ConfigManager
@@ -49,6 +49,8 @@ class ConfigManager:
             "DEFAULT_INTERFACE": "cli",
             "ENABLE_GUI": False,
             "ENABLE_VOICE": False,
+            "WHISPER_BACKEND": "faster-whisper",  # Options: faster-whisper, openvino
+            "OPENVINO_DEVICE": "NPU",
             "CLI_PROMPT": "Hohenheim> "
         }
         
@@ -122,6 +122,10 @@ class HohenheimAGI:
     def stop(self) -> None:
         """Stop the AGI system and all its components"""
         self.is_running = False
+        
+        # Persist queued long-term memories now rather than relying on atexit
+        self.long_term_memory.flush()
+        
         self.logger.info(f"{self.name} AGI System stopped")
         
         # Record system stop in memory
@@ -0,0 +1,160 @@
+"""
+Daemon Interface - Unix socket server for the Hohenheim AGI system
+Keeps the AGI loaded so short-lived clients avoid the startup cost
+"""
+
+import os
+import json
+import stat
+import signal
+import socket
+import logging
+from typing import Dict, Any
+
+# Seconds a connected client may stay idle before it is dropped; requests are
+# served one at a time, so an idle client would otherwise block everyone else
+_CLIENT_TIMEOUT = 30.0
+
+class DaemonInterface:
+    """
+    Unix socket interface for the Hohenheim AGI system.
+    Serves line-delimited JSON requests of the form {"command": "..."} and
+    answers each with one line of JSON holding the command response.
+    """
+    
+    def __init__(self, agi_core):
+        """
+        Initialize the daemon interface
+        
+        Args:
+            agi_core: Reference to the main AGI core instance
+        """
+        self.agi_core = agi_core
+        self.logger = logging.getLogger("Hohenheim.DaemonInterface")
+        self.running = False
+        self._busy = False
+    
+    def start(self, socket_path: str) -> None:
+        """
+        Start serving requests on a Unix socket
+        
+        Args:
+            socket_path: Filesystem path to bind the socket to
+        """
+        self._remove_stale_socket(socket_path)
+        
+        # Create the socket owner-only from the start rather than chmod-ing it after bind
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        
+        self.running = True
+        self.agi_core.start()
+        previous_handler = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        self.logger.info(f"Daemon listening on {socket_path}")
+        
+        try:
+            while self.running:
+                conn, _ = server.accept()
+                self._busy = True
+                with conn:
+                    conn.settimeout(_CLIENT_TIMEOUT)
+                    self._serve_connection(conn)
+                self._busy = False
+        except KeyboardInterrupt:
+            self.logger.info("Daemon interrupted")
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            server.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            # Stopping the core also flushes long-term memory to disk
+            self.agi_core.stop()
+            self.logger.info("Daemon stopped")
+    
+    def _handle_sigterm(self, signum, frame) -> None:
+        """
+        Shut down on SIGTERM through the same path as Ctrl+C. A request in
+        progress is allowed to finish so memory stores are not left half-updated.
+        """
+        self.logger.info("Received SIGTERM, shutting down")
+        self.running = False
+        if not self._busy:
+            raise KeyboardInterrupt
+    
+    def _remove_stale_socket(self, socket_path: str) -> None:
+        """
+        Remove a socket left behind by a previous run, refusing to take over
+        one that a running daemon still answers on
+        
+        Args:
+            socket_path: Filesystem path the daemon will bind to
+        """
+        try:
+            mode = os.lstat(socket_path).st_mode
+        except FileNotFoundError:
+            return
+        
+        # Never delete something that merely happens to sit at the socket path
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError(f"{socket_path} exists and is not a socket")
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except ConnectionRefusedError:
+                self.logger.info(f"Removing stale socket {socket_path}")
+                os.remove(socket_path)
+                return
+        
+        raise RuntimeError(f"Another Hohenheim daemon is already listening on {socket_path}")
+    
+    def _serve_connection(self, conn: socket.socket) -> None:
+        """
+        Answer every request line sent on a client connection
+        
+        Args:
+            conn: Accepted client connection
+        """
+        try:
+            with conn.makefile("rwb") as stream:
+                for line in stream:
+                    if not line.strip():
+                        continue
+                    
+                    response = self._handle_request(line)
+                    stream.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+                    stream.flush()
+                    
+                    # A shutdown requested mid-request takes effect once it is answered
+                    if not self.running:
+                        break
+        except socket.timeout:
+            self.logger.warning("Dropping idle daemon client")
+        except Exception as e:
+            self.logger.error(f"Error serving daemon client: {str(e)}")
+    
+    def _handle_request(self, line: bytes) -> Dict[str, Any]:
+        """
+        Run one JSON request through the AGI
+        
+        Args:
+            line: Raw request line
+        
+        Returns:
+            Response dictionary from the AGI
+        """
+        try:
+            request = json.loads(line)
+            command = request.get("command", "").strip()
+            if not command:
+                return {"error": "No command provided"}
+            
+            return self.agi_core.process_command(command, request.get("context"))
+        except Exception as e:
+            self.logger.error(f"Error processing daemon request: {str(e)}")
+            return {"error": str(e)}
@@ -9,11 +9,15 @@ import logging
 import numpy as np
 import queue
 import sounddevice as sd
-import soundfile as sf
 from typing import Optional, Dict, Any, List
 from elevenlabs import text_to_speech, play, stream
 from elevenlabs.client import ElevenLabs
 
+# Let oneDNN run Whisper's CPU matmuls on BF16 units where the hardware has them
+os.environ.setdefault("DNNL_DEFAULT_FPMATH_MODE", "BF16")
+os.environ.setdefault("THP_MEM_ALLOC_ENABLE", "1")
+os.environ.setdefault("LRU_CACHE_CAPACITY", "1024")
+
 class VoiceInterface:
     """Voice interface for Hohenheim AGI"""
     
@@ -29,10 +33,13 @@ class VoiceInterface:
         self.audio_data = []
         self.stream = None
         
-        # Initialize Whisper model
+        # Initialize Whisper model on the GPU when one is available
+        self.whisper_device = "cpu"
         try:
+            import torch
             import whisper
-            self.whisper_model = whisper.load_model("base")
+            self.whisper_device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.whisper_model = whisper.load_model("base", device=self.whisper_device)
             self.logger.info("Whisper model loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load Whisper model: {str(e)}")
@@ -94,17 +101,25 @@ class VoiceInterface:
                 self.logger.warning("No audio data captured")
                 return ""
             
-            # Convert to numpy array and save as WAV
-            audio_array = np.concatenate(audio_data, axis=0)
-            temp_wav = "temp_recording.wav"
-            sf.write(temp_wav, audio_array, 16000)
+            # Convert to a mono float32 buffer in [-1, 1] for Whisper
+            # Copy chunks into one preallocated array (no concatenate temporaries)
+            sizes = [chunk.shape[0] for chunk in audio_data]
+            audio_array = np.empty((sum(sizes), 1), dtype=audio_data[0].dtype)
+            offset = 0
+            for chunk, size in zip(audio_data, sizes):
+                audio_array[offset:offset + size] = chunk
+                offset += size
+            scale = np.iinfo(audio_array.dtype).max if np.issubdtype(audio_array.dtype, np.integer) else 1.0
+            audio_f32 = audio_array.flatten().astype(np.float32) / scale
             
             print("Transcribing audio...")
             
-            # Transcribe with Whisper
+            # Transcribe with Whisper directly from memory
             if self.whisper_model:
-                result = self.whisper_model.transcribe(temp_wav)
-                os.remove(temp_wav)
+                result = self.whisper_model.transcribe(
+                    audio_f32,
+                    fp16=self.whisper_device == "cuda"
+                )
                 transcribed_text = result["text"].strip()
                 self.logger.info(f"Transcribed: {transcribed_text}")
                 return transcribed_text
@@ -4,19 +4,486 @@ Provides a sleek, modern interface with advanced functionality
 """
 
 import os
+import re
+import hashlib
+import bisect
+import html
 import time
 import logging
 import gradio as gr
 from typing import Dict, List, Any, Optional, Tuple
 import json
-import plotly.graph_objects as go
 from datetime import datetime
 import numpy as np
 import queue
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import sounddevice as sd
-import soundfile as sf
 from elevenlabs import generate, play, set_api_key
-import whisper
+from faster_whisper import WhisperModel
+import ctranslate2
+
+def _format_headline(response: Dict[str, Any]) -> str:
+    """Format the main line of a response; an error replaces the message"""
+    if 'error' in response:
+        return f"Error: {response['error']}"
+    return response.get('message', 'No response generated.')
+
+def _format_reasoning(reasoning: Any) -> str:
+    """Format the reasoning section of a response"""
+    return f"\n\nReasoning:\n{reasoning}"
+
+def _format_memories(memories: List[Any]) -> str:
+    """Format the relevant memories section of a response"""
+    if not memories:
+        return ""
+    
+    # Memory lists are homogeneous, so pick the renderer once up front
+    if isinstance(memories[0], dict):
+        render = lambda memory: memory.get('content', str(memory))
+    else:
+        render = str
+    
+    lines = [f"{i}. {render(memory)}\n" for i, memory in enumerate(memories, 1)]
+    return "\n\nRelevant Memories:\n" + "".join(lines)
+
+def _merge_transcripts(previous: str, new: str, max_overlap_words: int = 8) -> str:
+    """
+    Append a chunk transcript to the running transcript, dropping the words
+    both chunks transcribed from the shared overlap window
+    """
+    prev_words = previous.split()
+    new_words = new.split()
+    if not prev_words:
+        return new.strip()
+    
+    normalize = lambda word: word.strip(".,!?;:\"'").lower()
+    tail = [normalize(w) for w in prev_words[-max_overlap_words:]]
+    head = [normalize(w) for w in new_words[:max_overlap_words]]
+    
+    # Longest suffix of the previous chunk that the new chunk repeats as its prefix
+    overlap = 0
+    for k in range(min(len(tail), len(head)), 0, -1):
+        if tail[-k:] == head[:k]:
+            overlap = k
+            break
+    
+    return " ".join(prev_words + new_words[overlap:])
+
+@lru_cache(maxsize=1)
+def _tts_disk_cache() -> Any:
+    """Open the on-disk TTS cache, or return None if diskcache is not installed"""
+    try:
+        import diskcache
+    except ImportError:
+        logging.getLogger("Hohenheim.WebGUI").warning("diskcache not installed, TTS cache will not persist")
+        return None
+    return diskcache.Cache("./.tts_cache")
+
+@lru_cache(maxsize=256)
+def _tts_cached(voice_id: str, model: str, text: str) -> bytes:
+    """Generate speech with ElevenLabs, reusing audio already synthesized for this text"""
+    disk_cache = _tts_disk_cache()
+    key = f"{voice_id}:{model}:{text}"
+    if disk_cache is not None:
+        audio = disk_cache.get(key)
+        if audio is not None:
+            return audio
+    
+    audio = generate(text=text, voice=voice_id, model=model)
+    if disk_cache is not None:
+        disk_cache.set(key, audio)
+    return audio
+
+@lru_cache(maxsize=32)
+def _render_memory_chart(memory_types: Tuple[Tuple[str, int], ...], bar_color: str,
+                         background: str, text_color: str, grid_color: str) -> str:
+    """Render memory type counts as an inline SVG bar chart"""
+    width, height = 600, 320
+    left, right, top, bottom = 48, 16, 40, 56
+    plot_w, plot_h = width - left - right, height - top - bottom
+    max_count = max((count for _, count in memory_types), default=0) or 1
+    slot = plot_w / max(len(memory_types), 1)
+    
+    elements = [
+        f'<rect width="{width}" height="{height}" fill="{background}"/>',
+        f'<text x="{width / 2}" y="24" fill="{text_color}" font-size="16" text-anchor="middle">Memory Distribution</text>',
+        f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" y2="{top + plot_h}" stroke="{grid_color}"/>',
+        f'<text x="{left - 8}" y="{top + 4}" fill="{text_color}" font-size="11" text-anchor="end">{max_count}</text>',
+        f'<text x="{left - 8}" y="{top + plot_h}" fill="{text_color}" font-size="11" text-anchor="end">0</text>'
+    ]
+    for i, (memory_type, count) in enumerate(memory_types):
+        bar_h = plot_h * count / max_count
+        x = left + i * slot + slot * 0.15
+        center = left + i * slot + slot / 2
+        elements.append(
+            f'<rect x="{x:.1f}" y="{top + plot_h - bar_h:.1f}" width="{slot * 0.7:.1f}" '
+            f'height="{bar_h:.1f}" fill="{bar_color}"><title>{html.escape(memory_type)}: {count}</title></rect>'
+        )
+        elements.append(
+            f'<text x="{center:.1f}" y="{top + plot_h + 18}" fill="{text_color}" font-size="11" '
+            f'text-anchor="middle">{html.escape(memory_type)}</text>'
+        )
+    
+    return (
+        f'<svg viewBox="0 0 {width} {height}" width="100%" xmlns="http://www.w3.org/2000/svg">'
+        + "".join(elements)
+        + '</svg>'
+    )
+
+@lru_cache(maxsize=16)
+def _status_html(running: bool, uncensored: bool, st_total: int, lt_total: int) -> str:
+    """Render the system status card; cached since polling mostly sees unchanged state"""
+    return f"""
+                                ### System Status
+                                <div class="status-card">
+                                    <div class="status-row">
+                                        <span class="status-indicator status-{'active' if running else 'inactive'}"></span>
+                                        System Status: {'Running' if running else 'Stopped'}
+                                    </div>
+                                    <div class="status-row">
+                                        <span class="status-indicator status-{'active' if uncensored else 'inactive'}"></span>
+                                        Uncensored Mode: {'Enabled' if uncensored else 'Disabled'}
+                                    </div>
+                                </div>
+                                
+                                ### Memory Stats
+                                <div class="status-card">
+                                    <div>Short-term Memory: {st_total} items</div>
+                                    <div>Long-term Memory: {lt_total} items</div>
+                                </div>
+                                """
+
+# Sentence boundaries used to pipeline TTS generation with playback
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# Streaming transcription: 2 s chunks sharing 500 ms with the previous chunk
+_SAMPLE_RATE = 16000
+_CHUNK_SAMPLES = 2 * _SAMPLE_RATE
+_OVERLAP_SAMPLES = _SAMPLE_RATE // 2
+
+# Response sections appended after the headline, in display order
+_FORMATTERS = {
+    'reasoning': _format_reasoning,
+    'memories': _format_memories
+}
+
+# Basic command suggestions, plus a sorted copy for prefix lookups
+_BASIC_COMMANDS = [
+    "help",
+    "status",
+    "memory",
+    "search",
+    "learn",
+    "analyze",
+    "summarize",
+    "create",
+    "explain",
+    "remember"
+]
+_BASIC_COMMANDS_SORTED = sorted(_BASIC_COMMANDS)
+
+_CUSTOM_CSS = """
+.gradio-container {
+    background-color: var(--background-color);
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, system-ui, sans-serif;
+    max-width: 1400px !important;
+    margin: 0 auto;
+}
+
+:root {
+    --background-color: #0F1117;
+    --surface-color: #1F2128;
+    --surface-2-color: #2F313A;
+    --primary-color: #2D7FF9;
+    --text-color: #F8FAFC;
+    --text-secondary: #94A3B8;
+    --border-color: #2E3440;
+}
+
+.container {
+    background: var(--surface-color);
+    border: 1px solid var(--border-color);
+    border-radius: 12px;
+    padding: 24px;
+    margin-bottom: 24px;
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+}
+
+.header {
+    padding: 24px;
+    border-bottom: 1px solid var(--border-color);
+    background: var(--surface-color);
+    margin-bottom: 32px;
+}
+
+.header h1 {
+    color: var(--text-color);
+    font-size: 28px;
+    font-weight: 600;
+    margin: 0;
+    letter-spacing: -0.02em;
+}
+
+.header h3 {
+    color: var(--text-secondary);
+    font-size: 16px;
+    font-weight: 400;
+    margin: 8px 0 0 0;
+}
+
+.chat-container {
+    display: flex;
+    flex-direction: column;
+    height: calc(100vh - 240px);
+    background: var(--surface-color);
+    border-radius: 12px;
+    overflow: hidden;
+}
+
+.chat-messages {
+    flex-grow: 1;
+    overflow-y: auto;
+    padding: 24px;
+}
+
+.message {
+    display: flex;
+    margin-bottom: 24px;
+    opacity: 0;
+    animation: fadeIn 0.3s ease forwards;
+}
+
+.message-content {
+    max-width: 80%;
+    padding: 16px 20px;
+    border-radius: 12px;
+    font-size: 15px;
+    line-height: 1.5;
+}
+
+.user-message {
+    justify-content: flex-end;
+}
+
+.user-message .message-content {
+    background: var(--primary-color);
+    color: white;
+    border-radius: 12px 12px 0 12px;
+}
+
+.assistant-message {
+    justify-content: flex-start;
+}
+
+.assistant-message .message-content {
+    background: var(--surface-2-color);
+    color: var(--text-color);
+    border-radius: 12px 12px 12px 0;
+}
+
+.message-metadata {
+    font-size: 12px;
+    color: var(--text-secondary);
+    margin-top: 4px;
+}
+
+.input-container {
+    padding: 24px;
+    background: var(--surface-color);
+    border-top: 1px solid var(--border-color);
+}
+
+.input-box {
+    background: var(--surface-2-color);
+    border: 1px solid var(--border-color);
+    border-radius: 8px;
+    padding: 12px 16px;
+    color: var(--text-color);
+    font-size: 15px;
+    resize: none;
+    width: 100%;
+    transition: border-color 0.2s;
+}
+
+.input-box:focus {
+    border-color: var(--primary-color);
+    outline: none;
+}
+
+.button-container {
+    display: flex;
+    gap: 12px;
+    margin-top: 12px;
+}
+
+.button {
+    padding: 10px 16px;
+    border-radius: 8px;
+    font-size: 14px;
+    font-weight: 500;
+    cursor: pointer;
+    transition: all 0.2s;
+    border: none;
+}
+
+.button-primary {
+    background: var(--primary-color);
+    color: white;
+}
+
+.button-primary:hover {
+    background: #2468CC;
+    transform: translateY(-1px);
+}
+
+.button-secondary {
+    background: var(--surface-2-color);
+    color: var(--text-color);
+    border: 1px solid var(--border-color);
+}
+
+.button-secondary:hover {
+    background: var(--hover);
+    transform: translateY(-1px);
+}
+
+.tab-nav {
+    background: var(--surface-color);
+    padding: 0;
+    border-bottom: 1px solid var(--border-color);
+    margin-bottom: 32px;
+}
+
+.tab-nav button {
+    padding: 16px 24px;
+    color: var(--text-secondary);
+    font-size: 15px;
+    font-weight: 500;
+    background: none;
+    border: none;
+    border-bottom: 2px solid transparent;
+    cursor: pointer;
+    transition: all 0.2s;
+}
+
+.tab-nav button:hover {
+    color: var(--text-color);
+}
+
+.tab-nav button.selected {
+    color: var(--text-color);
+    border-bottom-color: var(--primary-color);
+}
+
+.status-card {
+    background: var(--surface-color);
+    border: 1px solid var(--border-color);
+    border-radius: 12px;
+    padding: 20px;
+    margin-bottom: 24px;
+}
+
+.status-row {
+    display: flex;
+    align-items: center;
+    margin-bottom: 16px;
+}
+
+.status-indicator {
+    width: 8px;
+    height: 8px;
+    border-radius: 50%;
+    margin-right: 12px;
+}
+
+.status-active {
+    background: var(--success);
+    box-shadow: 0 0 8px rgba(34, 197, 94, 0.4);
+}
+
+.status-inactive {
+    background: var(--error);
+    box-shadow: 0 0 8px rgba(239, 68, 68, 0.4);
+}
+
+.memory-list {
+    background: var(--surface-color);
+    border: 1px solid var(--border-color);
+    border-radius: 12px;
+    height: 400px;
+    overflow-y: auto;
+}
+
+.memory-item {
+    padding: 16px;
+    border-bottom: 1px solid var(--border-color);
+    transition: background 0.2s;
+}
+
+.memory-item:hover {
+    background: var(--surface-2-color);
+}
+
+.memory-type {
+    color: var(--text-secondary);
+    font-size: 13px;
+    margin-bottom: 4px;
+}
+
+.memory-content {
+    color: var(--text-color);
+    font-size: 14px;
+    line-height: 1.5;
+}
+
+.search-box {
+    background: var(--surface-2-color);
+    border: 1px solid var(--border-color);
+    border-radius: 8px;
+    padding: 10px 16px;
+    color: var(--text-color);
+    font-size: 14px;
+    width: 100%;
+    margin-bottom: 16px;
+    transition: border-color 0.2s;
+}
+
+.search-box:focus {
+    border-color: var(--primary-color);
+    outline: none;
+}
+
+/* Scrollbar styling */
+::-webkit-scrollbar {
+    width: 8px;
+    height: 8px;
+}
+
+::-webkit-scrollbar-track {
+    background: var(--surface-color);
+}
+
+::-webkit-scrollbar-thumb {
+    background: var(--surface-2-color);
+    border-radius: 4px;
+}
+
+::-webkit-scrollbar-thumb:hover {
+    background: var(--hover);
+}
+
+/* Animations */
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(8px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+
+.fade-in {
+    animation: fadeIn 0.3s ease forwards;
+}
+"""
 
 class WebGUI:
     """Professional web-based GUI for the Hohenheim AGI system"""
@@ -26,20 +493,29 @@ class WebGUI:
         self.logger = logging.getLogger("Hohenheim.WebGUI")
         self.chat_history = []
         
+        # Interned chat messages keyed by a hash of role and content
+        self._msg_cache: Dict[str, Dict[str, str]] = {}
+        
         # Voice settings
         self.voice_enabled = False
         self.recording = False
-        self.audio_queue = queue.Queue()
-        self.audio_data = []
         self.stream = None
         
-        # Initialize Whisper model
-        try:
-            self.whisper_model = whisper.load_model("base")
-            self.logger.info("Whisper model loaded successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to load Whisper model: {str(e)}")
-            self.whisper_model = None
+        # Pre-allocated recording buffer (60 s of 16 kHz mono) filled by the audio callback
+        self._rec_buf = np.empty((_SAMPLE_RATE * 60, 1), dtype=np.float32)
+        self._rec_idx = 0
+        
+        # Chunks are transcribed by a worker while recording continues
+        self._chunk_queue = queue.Queue()
+        self._chunk_start = 0
+        self._partial_text = ""
+        self._transcriber = None
+        
+        # Whisper model is loaded in the background so the UI can build meanwhile
+        self.whisper_backend = self.agi_core.config.get("WHISPER_BACKEND", "faster-whisper").lower()
+        self.whisper_model = None
+        self.ov_processor = None
+        self._model_ready = threading.Event()
             
         # Initialize ElevenLabs API if key is available
         elevenlabs_key = self.agi_core.config.get("ELEVENLABS_API_KEY", "")
@@ -54,6 +530,12 @@ class WebGUI:
             "model": "eleven_monolingual_v1"
         }
         
+        # Speech runs off the Gradio handler; the lock keeps playback from overlapping
+        self._tts_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts")
+        self._tts_lock = threading.Lock()
+        
+        threading.Thread(target=self._warm_up_voice, daemon=True).start()
+        
         # Professional dark theme colors
         self.colors = {
             "background": "#0F1117",    # Dark background
@@ -71,350 +553,128 @@ class WebGUI:
             "hover": "#323644"          # Hover state
         }
         
-        self.custom_css = self._load_custom_css()
-
-    def _load_custom_css(self) -> str:
-        return """
-        .gradio-container {
-            background-color: var(--background-color);
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, system-ui, sans-serif;
-            max-width: 1400px !important;
-            margin: 0 auto;
-        }
-
-        :root {
-            --background-color: #0F1117;
-            --surface-color: #1F2128;
-            --surface-2-color: #2F313A;
-            --primary-color: #2D7FF9;
-            --text-color: #F8FAFC;
-            --text-secondary: #94A3B8;
-            --border-color: #2E3440;
-        }
-
-        .container {
-            background: var(--surface-color);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 24px;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-        }
-
-        .header {
-            padding: 24px;
-            border-bottom: 1px solid var(--border-color);
-            background: var(--surface-color);
-            margin-bottom: 32px;
-        }
-
-        .header h1 {
-            color: var(--text-color);
-            font-size: 28px;
-            font-weight: 600;
-            margin: 0;
-            letter-spacing: -0.02em;
-        }
-
-        .header h3 {
-            color: var(--text-secondary);
-            font-size: 16px;
-            font-weight: 400;
-            margin: 8px 0 0 0;
-        }
-
-        .chat-container {
-            display: flex;
-            flex-direction: column;
-            height: calc(100vh - 240px);
-            background: var(--surface-color);
-            border-radius: 12px;
-            overflow: hidden;
-        }
-
-        .chat-messages {
-            flex-grow: 1;
-            overflow-y: auto;
-            padding: 24px;
-        }
-
-        .message {
-            display: flex;
-            margin-bottom: 24px;
-            opacity: 0;
-            animation: fadeIn 0.3s ease forwards;
-        }
-
-        .message-content {
-            max-width: 80%;
-            padding: 16px 20px;
-            border-radius: 12px;
-            font-size: 15px;
-            line-height: 1.5;
-        }
+        self.custom_css = _CUSTOM_CSS
 
-        .user-message {
-            justify-content: flex-end;
-        }
-
-        .user-message .message-content {
-            background: var(--primary-color);
-            color: white;
-            border-radius: 12px 12px 0 12px;
-        }
-
-        .assistant-message {
-            justify-content: flex-start;
-        }
-
-        .assistant-message .message-content {
-            background: var(--surface-2-color);
-            color: var(--text-color);
-            border-radius: 12px 12px 12px 0;
-        }
-
-        .message-metadata {
-            font-size: 12px;
-            color: var(--text-secondary);
-            margin-top: 4px;
-        }
-
-        .input-container {
-            padding: 24px;
-            background: var(--surface-color);
-            border-top: 1px solid var(--border-color);
-        }
-
-        .input-box {
-            background: var(--surface-2-color);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            padding: 12px 16px;
-            color: var(--text-color);
-            font-size: 15px;
-            resize: none;
-            width: 100%;
-            transition: border-color 0.2s;
-        }
-
-        .input-box:focus {
-            border-color: var(--primary-color);
-            outline: none;
-        }
-
-        .button-container {
-            display: flex;
-            gap: 12px;
-            margin-top: 12px;
-        }
-
-        .button {
-            padding: 10px 16px;
-            border-radius: 8px;
-            font-size: 14px;
-            font-weight: 500;
-            cursor: pointer;
-            transition: all 0.2s;
-            border: none;
-        }
-
-        .button-primary {
-            background: var(--primary-color);
-            color: white;
-        }
-
-        .button-primary:hover {
-            background: #2468CC;
-            transform: translateY(-1px);
-        }
-
-        .button-secondary {
-            background: var(--surface-2-color);
-            color: var(--text-color);
-            border: 1px solid var(--border-color);
-        }
-
-        .button-secondary:hover {
-            background: var(--hover);
-            transform: translateY(-1px);
-        }
-
-        .tab-nav {
-            background: var(--surface-color);
-            padding: 0;
-            border-bottom: 1px solid var(--border-color);
-            margin-bottom: 32px;
-        }
-
-        .tab-nav button {
-            padding: 16px 24px;
-            color: var(--text-secondary);
-            font-size: 15px;
-            font-weight: 500;
-            background: none;
-            border: none;
-            border-bottom: 2px solid transparent;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .tab-nav button:hover {
-            color: var(--text-color);
-        }
-
-        .tab-nav button.selected {
-            color: var(--text-color);
-            border-bottom-color: var(--primary-color);
-        }
-
-        .status-card {
-            background: var(--surface-color);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 24px;
-        }
-
-        .status-row {
-            display: flex;
-            align-items: center;
-            margin-bottom: 16px;
-        }
-
-        .status-indicator {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            margin-right: 12px;
-        }
-
-        .status-active {
-            background: var(--success);
-            box-shadow: 0 0 8px rgba(34, 197, 94, 0.4);
-        }
-
-        .status-inactive {
-            background: var(--error);
-            box-shadow: 0 0 8px rgba(239, 68, 68, 0.4);
-        }
-
-        .memory-list {
-            background: var(--surface-color);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            height: 400px;
-            overflow-y: auto;
-        }
-
-        .memory-item {
-            padding: 16px;
-            border-bottom: 1px solid var(--border-color);
-            transition: background 0.2s;
-        }
-
-        .memory-item:hover {
-            background: var(--surface-2-color);
-        }
-
-        .memory-type {
-            color: var(--text-secondary);
-            font-size: 13px;
-            margin-bottom: 4px;
-        }
-
-        .memory-content {
-            color: var(--text-color);
-            font-size: 14px;
-            line-height: 1.5;
-        }
-
-        .search-box {
-            background: var(--surface-2-color);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            padding: 10px 16px;
-            color: var(--text-color);
-            font-size: 14px;
-            width: 100%;
-            margin-bottom: 16px;
-            transition: border-color 0.2s;
-        }
-
-        .search-box:focus {
-            border-color: var(--primary-color);
-            outline: none;
-        }
-
-        /* Scrollbar styling */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
+    def _warm_up_voice(self) -> None:
+        """Load the Whisper model and warm up ElevenLabs off the main thread"""
+        try:
+            self.whisper_model = self._load_whisper_model()
+            self.logger.info(f"Whisper model loaded successfully ({self.whisper_backend})")
+        except Exception as e:
+            self.logger.error(f"Failed to load Whisper model: {str(e)}")
+            self.whisper_model = None
+        finally:
+            self._model_ready.set()
+        
+        if self.agi_core.config.get("ELEVENLABS_API_KEY", ""):
+            try:
+                generate(
+                    text=".",
+                    voice=self.voice_settings["voice_id"],
+                    model=self.voice_settings["model"]
+                )
+            except Exception as e:
+                self.logger.warning(f"ElevenLabs warm-up failed: {str(e)}")
 
-        ::-webkit-scrollbar-track {
-            background: var(--surface-color);
-        }
+    def _load_whisper_model(self) -> Any:
+        """Load the Whisper model for the configured backend"""
+        if self.whisper_backend == "openvino":
+            # INT8 OpenVINO model on an NPU/iGPU, leaving the CPU to Gradio and audio capture
+            from optimum.intel.openvino import OVModelForSpeechSeq2Seq
+            from transformers import AutoProcessor
+            
+            self.ov_processor = AutoProcessor.from_pretrained("openai/whisper-base")
+            return OVModelForSpeechSeq2Seq.from_pretrained(
+                "openai/whisper-base",
+                export=True,
+                load_in_8bit=True,
+                device=self.agi_core.config.get("OPENVINO_DEVICE", "NPU")
+            )
+        
+        # CTranslate2 backend: FP16 on GPU, INT8 on CPU
+        use_cuda = ctranslate2.get_cuda_device_count() > 0
+        return WhisperModel(
+            "base",
+            device="cuda" if use_cuda else "cpu",
+            compute_type="float16" if use_cuda else "int8",
+            cpu_threads=os.cpu_count() or 0
+        )
 
-        ::-webkit-scrollbar-thumb {
-            background: var(--surface-2-color);
-            border-radius: 4px;
-        }
+    def _transcribe(self, audio_f32: np.ndarray, initial_prompt: Optional[str] = None) -> str:
+        """Transcribe a mono 16 kHz float32 buffer with the loaded Whisper model"""
+        if self.whisper_backend == "openvino":
+            inputs = self.ov_processor(audio_f32, sampling_rate=_SAMPLE_RATE, return_tensors="pt")
+            ids = self.whisper_model.generate(inputs.input_features)
+            return self.ov_processor.batch_decode(ids, skip_special_tokens=True)[0].strip()
+        
+        segments, _ = self.whisper_model.transcribe(
+            audio_f32,
+            beam_size=1,
+            vad_filter=True,
+            initial_prompt=initial_prompt
+        )
+        return "".join(segment.text for segment in segments).strip()
 
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--hover);
-        }
+    def _transcription_worker(self) -> None:
+        """Transcribe recorded chunks as they arrive until a None sentinel"""
+        self._model_ready.wait()
+        while True:
+            chunk = self._chunk_queue.get()
+            if chunk is None:
+                break
+            if not self.whisper_model:
+                continue
+            
+            start, end = chunk
+            try:
+                # Condition each chunk on the tail of the transcript so far
+                text = self._transcribe(
+                    self._rec_buf[start:end].reshape(-1),
+                    initial_prompt=self._partial_text[-200:] or None
+                )
+                self._partial_text = _merge_transcripts(self._partial_text, text)
+            except Exception as e:
+                self.logger.error(f"Chunk transcription error: {str(e)}")
 
-        /* Animations */
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(8px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
 
-        .fade-in {
-            animation: fadeIn 0.3s ease forwards;
-        }
-        """
+    def _message(self, role: str, content: str) -> Dict[str, str]:
+        """Return a shared chat message object for this role and content"""
+        key = hashlib.blake2b(f"{role}:{content}".encode(), digest_size=8).hexdigest()
+        if len(self._msg_cache) >= 1024 and key not in self._msg_cache:
+            self._msg_cache.clear()
+        return self._msg_cache.setdefault(key, {"role": role, "content": content})
 
-    def process_command(self, command: str, history: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    def process_command(self, command: str, history: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """Process a command and update chat history"""
         if not command.strip():
             return history
         
         # Add user message
-        history.append(("user", command))
+        history.append(self._message("user", command))
         
         try:
             # Process command
             response = self.agi_core.process_command(command)
             
-            # Format response
-            output = response.get('message', 'No response generated.')
-            if 'error' in response:
-                output = f"Error: {response['error']}"
-            
-            # Add metadata if available
-            if 'reasoning' in response:
-                output += f"\n\nReasoning:\n{response['reasoning']}"
-            if 'memories' in response and response['memories']:
-                output += "\n\nRelevant Memories:\n"
-                for i, memory in enumerate(response['memories'], 1):
-                    if isinstance(memory, dict):
-                        output += f"{i}. {memory.get('content', str(memory))}\n"
-                    else:
-                        output += f"{i}. {str(memory)}\n"
+            # Format response, then add metadata sections if available
+            parts = [_format_headline(response)]
+            for key, formatter in _FORMATTERS.items():
+                if key in response:
+                    parts.append(formatter(response[key]))
+            output = "".join(parts)
             
             # Add system response
-            history.append(("assistant", output))
+            history.append(self._message("assistant", output))
             
             # Convert response to speech if enabled
             if self.voice_enabled:
                 # Extract just the main response without metadata for speech
                 main_response = response.get('message', 'No response generated.')
-                self.text_to_speech(main_response)
+                self._tts_executor.submit(self.text_to_speech, main_response)
             
         except Exception as e:
             self.logger.error(f"Error processing command: {str(e)}")
-            history.append(("assistant", f"Error: {str(e)}"))
+            history.append(self._message("assistant", f"Error: {str(e)}"))
         
         return history
 
@@ -424,20 +684,41 @@ class WebGUI:
             return
         
         self.recording = True
-        self.audio_data = []
+        self._rec_idx = 0
+        self._chunk_start = 0
+        self._partial_text = ""
+        self._chunk_queue = queue.Queue()
+        self._transcriber = threading.Thread(target=self._transcription_worker, daemon=True)
+        self._transcriber.start()
         
         def audio_callback(indata, frames, time, status):
             if status:
                 self.logger.warning(f"Audio recording status: {status}")
-            self.audio_queue.put(indata.copy())
+            start = self._rec_idx
+            end = min(start + len(indata), len(self._rec_buf))
+            self._rec_buf[start:end] = indata[:end - start]
+            self._rec_idx = end
+            
+            # Hand a full chunk (plus overlap with the previous one) to the worker
+            if end - self._chunk_start >= _CHUNK_SAMPLES:
+                self._chunk_queue.put((max(0, self._chunk_start - _OVERLAP_SAMPLES), end))
+                self._chunk_start = end
         
         try:
-            self.stream = sd.InputStream(callback=audio_callback, channels=1, samplerate=16000)
+            # Fixed 100 ms float32 blocks match the recording buffer, so the callback is a plain copy
+            self.stream = sd.InputStream(
+                callback=audio_callback,
+                channels=1,
+                samplerate=_SAMPLE_RATE,
+                dtype="float32",
+                blocksize=_SAMPLE_RATE // 10
+            )
             self.stream.start()
             self.logger.info("Started audio recording")
         except Exception as e:
             self.logger.error(f"Failed to start recording: {str(e)}")
             self.recording = False
+            self._chunk_queue.put(None)
 
     def stop_recording(self) -> str:
         """Stop recording and transcribe audio"""
@@ -450,25 +731,20 @@ class WebGUI:
             self.stream.stop()
             self.stream.close()
             
-            # Get all audio data from queue
-            audio_data = []
-            while not self.audio_queue.empty():
-                audio_data.append(self.audio_queue.get())
+            # Flush the tail that has not filled a whole chunk, then drain the worker
+            if self._rec_idx > self._chunk_start:
+                self._chunk_queue.put((max(0, self._chunk_start - _OVERLAP_SAMPLES), self._rec_idx))
+            self._chunk_queue.put(None)
+            self._transcriber.join()
             
-            if not audio_data:
+            if self._rec_idx == 0:
                 self.logger.warning("No audio data captured")
                 return ""
+            if self._rec_idx == len(self._rec_buf):
+                self.logger.warning("Recording reached the buffer limit and was truncated")
             
-            # Convert to numpy array and save as WAV
-            audio_array = np.concatenate(audio_data, axis=0)
-            temp_wav = "temp_recording.wav"
-            sf.write(temp_wav, audio_array, 16000)
-            
-            # Transcribe with Whisper
             if self.whisper_model:
-                result = self.whisper_model.transcribe(temp_wav)
-                os.remove(temp_wav)
-                transcribed_text = result["text"].strip()
+                transcribed_text = self._partial_text
                 self.logger.info(f"Transcribed: {transcribed_text}")
                 return transcribed_text
             else:
@@ -496,15 +772,33 @@ class WebGUI:
                 self.logger.info("Text too long, truncating for TTS")
                 text = text[:1000] + "..."
                 
-            # Generate audio using ElevenLabs
-            audio = generate(
-                text=text,
-                voice=self.voice_settings["voice_id"],
-                model=self.voice_settings["model"]
-            )
+            # Generate audio sentence by sentence (cached by voice, model and text)
+            # so playback starts after the first sentence instead of the whole reply
+            sentences = [sentence for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+            audio_queue = queue.Queue(maxsize=2)
+            
+            def produce():
+                try:
+                    for sentence in sentences:
+                        audio_queue.put(_tts_cached(
+                            self.voice_settings["voice_id"],
+                            self.voice_settings["model"],
+                            sentence
+                        ))
+                except Exception as e:
+                    self.logger.error(f"Text-to-speech error: {str(e)}")
+                finally:
+                    audio_queue.put(None)
             
-            # Play audio directly
-            play(audio)
+            threading.Thread(target=produce, daemon=True).start()
+            
+            # Play audio as it arrives, one utterance at a time on the sound card
+            with self._tts_lock:
+                while True:
+                    audio = audio_queue.get()
+                    if audio is None:
+                        break
+                    play(audio)
             
         except Exception as e:
             self.logger.error(f"Text-to-speech error: {str(e)}")
@@ -527,70 +821,34 @@ class WebGUI:
 
     def get_command_suggestions(self, text: str) -> List[str]:
         """Get command suggestions based on user input"""
-        # Basic command suggestions
-        basic_commands = [
-            "help",
-            "status",
-            "memory",
-            "search",
-            "learn",
-            "analyze",
-            "summarize",
-            "create",
-            "explain",
-            "remember"
-        ]
-        
         # Filter suggestions based on input
         if not text:
-            return basic_commands[:5]  # Return top 5 if no input
+            return _BASIC_COMMANDS[:5]  # Return top 5 if no input
         
-        # Filter commands that start with the input text
-        filtered = [cmd for cmd in basic_commands if cmd.startswith(text.lower())]
+        # Commands that start with the input text form a contiguous sorted range
+        text = text.lower()
+        lo = bisect.bisect_left(_BASIC_COMMANDS_SORTED, text)
+        hi = bisect.bisect_left(_BASIC_COMMANDS_SORTED, text + "\uffff")
+        filtered = _BASIC_COMMANDS_SORTED[lo:hi]
         
         # If no direct matches, find commands that contain the input
         if not filtered:
-            filtered = [cmd for cmd in basic_commands if text.lower() in cmd]
+            filtered = [cmd for cmd in _BASIC_COMMANDS if text in cmd]
         
         return filtered[:5]  # Return top 5 matches
 
-    def create_memory_visualization(self) -> go.Figure:
-        """Create memory visualization using Plotly"""
+    def create_memory_visualization(self) -> str:
+        """Create memory visualization as a static SVG bar chart"""
         stats = self.get_memory_stats()
         memory_types = stats["short_term"]["by_type"]
         
-        fig = go.Figure()
-        
-        # Add bar chart for memory types
-        fig.add_trace(go.Bar(
-            x=list(memory_types.keys()),
-            y=list(memory_types.values()),
-            name="Memory Types",
-            marker_color=self.colors["primary"]
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            plot_bgcolor=self.colors["surface"],
-            paper_bgcolor=self.colors["surface"],
-            font_color=self.colors["text"],
-            title={
-                'text': 'Memory Distribution',
-                'font': {'color': self.colors["text"]}
-            },
-            xaxis={
-                'title': 'Memory Type',
-                'color': self.colors["text"],
-                'gridcolor': self.colors["border"]
-            },
-            yaxis={
-                'title': 'Count',
-                'color': self.colors["text"],
-                'gridcolor': self.colors["border"]
-            }
+        return _render_memory_chart(
+            tuple(sorted(memory_types.items())),
+            self.colors["primary"],
+            self.colors["surface"],
+            self.colors["text"],
+            self.colors["border"]
         )
-        
-        return fig
 
     def start(self, server_port: int = 50920) -> None:
         """Start the web GUI interface"""
@@ -626,6 +884,7 @@ class WebGUI:
                         
                         chatbot = gr.Chatbot(
                             value=self.chat_history,
+                            type="messages",
                             height=500,
                             show_label=False,
                             elem_classes="chat-messages",
@@ -653,7 +912,7 @@ class WebGUI:
                     with gr.Row():
                         with gr.Column(scale=2):
                             gr.Markdown("### Memory Overview")
-                            memory_plot = gr.Plot(
+                            memory_plot = gr.HTML(
                                 self.create_memory_visualization(),
                                 elem_classes="memory-viz"
                             )
@@ -684,25 +943,12 @@ class WebGUI:
                             
                             def get_status():
                                 stats = self.get_memory_stats()
-                                return f"""
-                                ### System Status
-                                <div class="status-card">
-                                    <div class="status-row">
-                                        <span class="status-indicator status-{'active' if self.agi_core.is_running else 'inactive'}"></span>
-                                        System Status: {'Running' if self.agi_core.is_running else 'Stopped'}
-                                    </div>
-                                    <div class="status-row">
-                                        <span class="status-indicator status-{'active' if self.agi_core.uncensored_mode else 'inactive'}"></span>
-                                        Uncensored Mode: {'Enabled' if self.agi_core.uncensored_mode else 'Disabled'}
-                                    </div>
-                                </div>
-                                
-                                ### Memory Stats
-                                <div class="status-card">
-                                    <div>Short-term Memory: {stats['short_term']['total']} items</div>
-                                    <div>Long-term Memory: {stats['long_term']['total']} items</div>
-                                </div>
-                                """
+                                return _status_html(
+                                    self.agi_core.is_running,
+                                    self.agi_core.uncensored_mode,
+                                    stats['short_term']['total'],
+                                    stats['long_term']['total']
+                                )
                             
                             refresh.click(get_status, None, status_md)
                             status_md.value = get_status()  # Initial status
@@ -754,25 +1000,35 @@ class WebGUI:
                                 )
             
             # Event handlers
-            def process_message(message: str, history: List) -> Tuple[List, str]:
-                """Process message and update UI"""
-                status_text.visible = True
-                status_text.value = "Processing..."
-                new_history = self.process_command(message, history)
-                status_text.visible = False
-                return new_history, ""
+            def process_message(message: str, history: List):
+                """Process message and stream UI updates"""
+                # Show the user message with a placeholder reply right away; only
+                # the last bubble changes when the real reply replaces it
+                if message.strip():
+                    yield history + [
+                        self._message("user", message),
+                        self._message("assistant", "Processing...")
+                    ], ""
+                yield self.process_command(message, history), ""
 
-            # Chat interactions
+            # Chat interactions share one slot: the AGI core and its memory
+            # stores are not thread-safe, so commands run one at a time
             submit.click(
                 fn=process_message,
                 inputs=[msg, chatbot],
-                outputs=[chatbot, msg]
+                outputs=[chatbot, msg],
+                queue=True,
+                concurrency_limit=1,
+                concurrency_id="chat"
             )
             
             msg.submit(
                 fn=process_message,
                 inputs=[msg, chatbot],
-                outputs=[chatbot, msg]
+                outputs=[chatbot, msg],
+                queue=True,
+                concurrency_limit=1,
+                concurrency_id="chat"
             )
             
             clear.click(
@@ -793,7 +1049,8 @@ class WebGUI:
 
             voice_btn.click(
                 fn=toggle_voice,
-                outputs=[status_text]
+                outputs=[status_text],
+                concurrency_limit=16
             )
 
             # Recording control
@@ -813,7 +1070,8 @@ class WebGUI:
 
             record_btn.click(
                 fn=toggle_recording,
-                outputs=[msg, record_btn]
+                outputs=[msg, record_btn],
+                concurrency_limit=1
             )
             
             refresh_memory.click(
@@ -827,10 +1085,10 @@ class WebGUI:
                 outputs=[status_text]
             )
         
-        # Launch the interface
+        # Launch the interface with a bounded request queue served concurrently
+        interface.queue(max_size=32, default_concurrency_limit=4)
         interface.launch(
             server_name="0.0.0.0",
             server_port=server_port,
-            share=False,
-            debug=True
+            share=False
         )
@@ -8,13 +8,57 @@ import sys
 import argparse
 import logging
 import time
+import atexit
+import threading
 
-from core.agi_core import HohenheimAGI
-from interfaces.cli import TerminalInterface
+def _socket_path():
+    """Path of the Unix socket shared by the daemon and client interfaces"""
+    return os.path.join(os.environ.get("XDG_RUNTIME_DIR") or "/tmp", "hohenheim.sock")
+
+def _run_client(command):
+    """
+    Send one command to a running daemon and print the reply.
+    Only socket and json are imported so the client starts instantly.
+    
+    Args:
+        command: Command string to send
+        
+    Returns:
+        Process exit code
+    """
+    import json
+    import socket
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(_socket_path())
+            sock.sendall(json.dumps({"command": command}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                reply = stream.readline()
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("Hohenheim daemon is not running. Start it with: python main.py -i daemon")
+        return 1
+    except ConnectionError as e:
+        print(f"Lost connection to the Hohenheim daemon: {str(e)}")
+        return 1
+    
+    try:
+        response = json.loads(reply)
+    except ValueError:
+        print("Hohenheim daemon closed the connection without a valid reply")
+        return 1
+    
+    if "error" in response:
+        print(f"Error: {response['error']}")
+        return 1
+    
+    print(response.get("message") or json.dumps(response, indent=2))
+    return 0
 
 def parse_arguments():
     """Parse command line arguments"""
-    parser = argparse.ArgumentParser(description="Hohenheim AGI System")
+    # Help is registered last so it lists the interface-specific arguments too
+    parser = argparse.ArgumentParser(description="Hohenheim AGI System", add_help=False)
     
     parser.add_argument(
         "--config", "-c",
@@ -24,16 +68,16 @@ def parse_arguments():
     
     parser.add_argument(
         "--interface", "-i",
-        help="Interface to use (cli, web, api)",
-        choices=["cli", "web", "api"],
+        help="Interface to use (cli, web, api, daemon, client)",
+        choices=["cli", "web", "api", "daemon", "client"],
         default="cli"
     )
     
     parser.add_argument(
         "--port", "-p",
-        help="Port for web or API interface",
+        help="Port for web or API interface (default 57264; only with -i web or -i api)",
         type=int,
-        default=57264
+        default=None
     )
     
     parser.add_argument(
@@ -55,7 +99,75 @@ def parse_arguments():
         action="store_true"
     )
     
-    return parser.parse_args()
+    # Parse the common arguments first (abbreviations and grouped short flags
+    # included) to learn the interface, then register only what it uses
+    interface = parser.parse_known_args()[0].interface
+    
+    # The client forwards the remaining words to the daemon as one command
+    if interface == "client":
+        parser.add_argument(
+            "command",
+            help="Command to send to the running daemon",
+            nargs="+"
+        )
+    
+    parser.add_argument(
+        "--help", "-h",
+        help="Show this help message and exit",
+        action="help"
+    )
+    
+    args = parser.parse_args()
+    
+    # Only the web and API interfaces listen on a port
+    if args.interface in ("web", "api"):
+        if args.port is None:
+            args.port = 57264
+    elif args.port is not None:
+        parser.error(f"--port only applies to -i web or -i api, not -i {args.interface}")
+    
+    return args
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that buffers writes instead of flushing every record.
+    The buffer is flushed every flush_interval seconds, at exit, and
+    immediately for records at ERROR or above.
+    """
+    
+    def __init__(self, filename, flush_interval=1.0, buffer_size=65536):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename)
+        
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_periodically, daemon=True).start()
+        atexit.register(self.flush)
+    
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+    
+    def emit(self, record):
+        """Write a record to the buffer, flushing only for errors"""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self):
+        """Flush the buffer on a fixed interval until the handler is closed"""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        """Stop the periodic flush and close the file"""
+        self._stop_flushing.set()
+        super().close()
 
 def setup_logging(log_level):
     """Set up logging configuration"""
@@ -74,17 +186,18 @@ def setup_logging(log_level):
         level=numeric_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.FileHandler(log_file),
+            BufferedFileHandler(log_file),
             logging.StreamHandler(sys.stdout)
         ]
     )
     
-    # Create a symlink to the latest log
+    # Point logs/latest.log at this run's log with an atomic rename so
+    # concurrent runs never see it missing (the target is relative to logs/)
     latest_log = "logs/latest.log"
+    tmp_link = f"{latest_log}.{os.getpid()}.tmp"
     try:
-        if os.path.exists(latest_log):
-            os.remove(latest_log)
-        os.symlink(log_file, latest_log)
+        os.symlink(os.path.basename(log_file), tmp_link)
+        os.replace(tmp_link, latest_log)
     except Exception as e:
         logging.warning(f"Could not create symlink to latest log: {str(e)}")
 
@@ -93,10 +206,15 @@ def main():
     # Parse command line arguments
     args = parse_arguments()
     
+    # The client talks to an already running daemon and loads nothing else
+    if args.interface == "client":
+        sys.exit(_run_client(" ".join(args.command)))
+    
     # Set up logging
     setup_logging(args.log_level)
     
-    # Create AGI instance
+    # Create AGI instance (imported here so --help never loads the AGI stack)
+    from core.agi_core import HohenheimAGI
     agi = HohenheimAGI(config_path=args.config)
     
     # Set uncensored mode if requested
@@ -114,6 +232,7 @@ def main():
     
     # Start the appropriate interface
     if args.interface == "cli":
+        from interfaces.cli import TerminalInterface
         interface = TerminalInterface(agi)
         interface.start()
     elif args.interface == "web":
@@ -124,7 +243,7 @@ def main():
         except ImportError as e:
             logging.error(f"Web GUI dependencies not installed: {str(e)}")
             print(f"Web GUI dependencies not installed: {str(e)}")
-            print("Install required packages with: pip install gradio plotly pandas pillow")
+            print("Install required packages with: pip install gradio pandas pillow")
             sys.exit(1)
         except Exception as e:
             logging.error(f"Error starting web GUI: {str(e)}")
@@ -144,6 +263,15 @@ def main():
             logging.error(f"Error starting API interface: {str(e)}")
             print(f"Error starting API interface: {str(e)}")
             sys.exit(1)
+    elif args.interface == "daemon":
+        try:
+            from interfaces.daemon import DaemonInterface
+            daemon = DaemonInterface(agi)
+            daemon.start(_socket_path())
+        except Exception as e:
+            logging.error(f"Error starting daemon: {str(e)}")
+            print(f"Error starting daemon: {str(e)}")
+            sys.exit(1)
     else:
         logging.error(f"Unknown interface: {args.interface}")
         print(f"Unknown interface: {args.interface}")
@@ -0,0 +1,64 @@
+"""
+Short-Term Memory helpers - per-item indexing loops used on every add and search
+Fully annotated and free of dynamic tricks so it can be compiled with mypyc:
+
+    mypyc memory/_short_term_fast.py
+
+Python loads the compiled extension when it is present next to this file and
+runs this module as plain Python otherwise.
+"""
+
+import re
+from typing import Any, Iterator, List, Set, Tuple
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Longer values (model output, prompts) are left to the token index
+FIELD_VALUE_MAX = 128
+
+def leaves(data: Any) -> Iterator[str]:
+    """Yield every string and number nested in data, as strings"""
+    stack: List[Any] = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set)):
+            stack.extend(value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield str(value)
+
+def tokenize(data: Any) -> Set[str]:
+    """Collect the lowercased word tokens of every string and number in data"""
+    tokens: Set[str] = set()
+    for leaf in leaves(data):
+        tokens.update(TOKEN_RE.findall(leaf.lower()))
+    return tokens
+
+def search_text(data: Any) -> bytes:
+    """Lowercased UTF-8 text of data's leaves, one per line so matches can't span two"""
+    return "\n".join(leaves(data)).lower().encode("utf-8")
+
+def trigram_bloom(text: bytes) -> int:
+    """256-bit Bloom filter of the 3-byte substrings of text, two bits per trigram"""
+    bloom: int = 0
+    i: int
+    for i in range(len(text) - 2):
+        gram: int = text[i] << 16 | text[i + 1] << 8 | text[i + 2]
+        bloom |= 1 << ((gram * 0x9E3779B1 >> 24) & 255) | 1 << ((gram * 0x85EBCA6B >> 16) & 255)
+    return bloom
+
+def field_pairs(data: Any) -> Tuple[Tuple[str, str], ...]:
+    """Collect lowercased (field, value) pairs for the top-level scalar values of data"""
+    if not isinstance(data, dict):
+        return ()
+
+    pairs: List[Tuple[str, str]] = []
+    for key, value in data.items():
+        if isinstance(value, (str, int, float)):
+            text = str(value)
+            if len(text) <= FIELD_VALUE_MAX:
+                pairs.append((str(key).lower(), text.lower()))
+    return tuple(pairs)
@@ -8,9 +8,50 @@ import time
 import logging
 import json
 import uuid
-from typing import Dict, List, Any, Optional, Union
+import atexit
+import threading
+import re
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Union, Tuple
 import datetime
 
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize with orjson, using json for values orjson rejects (e.g. ints over 64 bits)"""
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, default=str).encode("utf-8")
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = lambda obj: json.dumps(obj, default=str).encode("utf-8")
+    _json_loads = json.loads
+
+class MemoryRecord:
+    """A memory held by the FAISS and in-memory backends"""
+    
+    __slots__ = ("id", "title", "content", "timestamp", "metadata")
+    
+    def __init__(self, id: str, title: str, content: str, timestamp: str, metadata: Dict[str, Any]):
+        self.id = id
+        self.title = title
+        self.content = content
+        self.timestamp = timestamp
+        self.metadata = metadata
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Public dictionary form of the record (metadata is shared, not copied)"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "metadata": self.metadata
+        }
+
 class LongTermMemory:
     """
     Long-term memory system for the Hohenheim AGI.
@@ -39,6 +80,24 @@ class LongTermMemory:
             "last_access": self.get_timestamp()
         }
         
+        # Hot paths record access time as a raw int; get_stats() formats it
+        self._last_access_ns = time.time_ns()
+        
+        # FAISS persistence is batched: the index and metadata are written every
+        # _flush_threshold changes, on flush(), and at interpreter exit
+        self._dirty = False
+        self._adds_since_flush = 0
+        self._flush_threshold = 64
+        
+        # FAISS adds are queued (with their serialized log line) and embedded
+        # in batches by flush_pending()
+        self._pending_docs: List[Tuple[str, MemoryRecord, bytes]] = []
+        self._pending_batch_size = 32
+        
+        # Guards the FAISS queue, index, metadata and log; re-entrant because
+        # adds flush batches and batches can trigger a full save
+        self._faiss_lock = threading.RLock()
+        
         # Initialize the vector database
         self._initialize_vector_db()
     
@@ -84,6 +143,17 @@ class LongTermMemory:
             self.stats["total_items"] = self.collection.count()
             self.stats["db_type"] = "chroma"
             
+            # Bind backend operations once instead of dispatching on db_type per call
+            self._add_impl = self._add_to_chroma
+            self._bulk_add_impl = self._bulk_add_to_chroma
+            self._search_impl = self._search_chroma
+            self._get_impl = self._get_chroma
+            self._delete_impl = self._delete_chroma
+            self._count_impl = self.collection.count
+            
+            # Finish lazy model setup before the first real query
+            self._warm_up_embeddings(self.embedding_function)
+            
             self.logger.info(f"Initialized Chroma vector database with {self.stats['total_items']} items")
             
         except ImportError:
@@ -98,48 +168,181 @@ class LongTermMemory:
             import numpy as np
             import pickle
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.vector_db_path), exist_ok=True)
+            # Ensure directory exists (the index and metadata files live inside it)
+            os.makedirs(self.vector_db_path, exist_ok=True)
             
             # Initialize embedding model
             self.embedding_model = SentenceTransformer(self.embedding_model)
             
-            # Path for index and metadata
+            # Path for index and metadata (an append-only JSONL log; older
+            # versions pickled the whole list). Raw embeddings are kept in a
+            # float32 memmap so the index can be rebuilt or topped up from them.
             index_path = os.path.join(self.vector_db_path, "faiss_index.bin")
-            metadata_path = os.path.join(self.vector_db_path, "faiss_metadata.pkl")
+            self._metadata_path = os.path.join(self.vector_db_path, "faiss_metadata.jsonl")
+            legacy_metadata_path = os.path.join(self.vector_db_path, "faiss_metadata.pkl")
+            self._embeddings_path = os.path.join(self.vector_db_path, "emb.f32")
+            dimension = self.embedding_model.get_sentence_embedding_dimension()
+            has_embeddings = os.path.exists(self._embeddings_path)
             
             # Check if existing index and metadata
-            if os.path.exists(index_path) and os.path.exists(metadata_path):
-                # Load existing index and metadata
+            rewrite_log = False
+            deleted_ids = set()
+            if os.path.exists(index_path) and os.path.exists(self._metadata_path):
+                # Load existing index and replay the metadata log
                 self.index = faiss.read_index(index_path)
-                with open(metadata_path, 'rb') as f:
-                    self.metadata = pickle.load(f)
+                self.metadata, deleted_ids = self._replay_metadata_log()
+            elif os.path.exists(index_path) and os.path.exists(legacy_metadata_path):
+                # Migrate pickled metadata to the log
+                self.index = faiss.read_index(index_path)
+                with open(legacy_metadata_path, 'rb') as f:
+                    self.metadata = []
+                    for item in pickle.load(f):
+                        record = self._record_from_log(item)
+                        if item.get("deleted"):
+                            deleted_ids.add(record.id)
+                        self.metadata.append(record)
+                rewrite_log = True
+            elif has_embeddings and os.path.exists(self._metadata_path):
+                # Index file is missing; the graph is rebuilt from the embeddings below
+                self.index = self._new_faiss_index(dimension)
+                self.metadata, deleted_ids = self._replay_metadata_log()
             else:
-                # Create new index and metadata
-                dimension = self.embedding_model.get_sentence_embedding_dimension()
-                self.index = faiss.IndexFlatL2(dimension)
+                self.index = self._new_faiss_index(dimension)
                 self.metadata = []
+                rewrite_log = True
             
-            # Update stats
-            self.stats["total_items"] = self.index.ntotal
+            # Map the embeddings file; stores from before it existed are seeded from the index
+            self._map_embeddings(max(len(self.metadata), self.index.ntotal))
+            if not has_embeddings and self.index.ntotal:
+                self._embeddings[:self.index.ntotal] = self.index.reconstruct_n(0, self.index.ntotal)
+            
+            # Older L2 indexes are rebuilt once as inner-product over unit vectors
+            if self.index.metric_type != faiss.METRIC_INNER_PRODUCT:
+                vectors = np.array(self._embeddings[:self.index.ntotal])
+                faiss.normalize_L2(vectors)
+                self._embeddings[:self.index.ntotal] = vectors
+                self.index = self._new_faiss_index(dimension)
+                self.index.add(vectors)
+                self._dirty = True
+            
+            # Search breadth for the HNSW graph
+            if hasattr(self.index, "hnsw"):
+                self.index.hnsw.efSearch = 64
+            
+            # Records logged after the last index save have their vectors in the
+            # embeddings file; add them back in one call. The file grows zero-filled
+            # and stored vectors are unit length, so the first all-zero row marks
+            # where the written vectors end; records from there on are dropped.
+            if len(self.metadata) > self.index.ntotal:
+                vectors = np.array(self._embeddings[self.index.ntotal:len(self.metadata)])
+                missing = np.flatnonzero(~vectors.any(axis=1))
+                if len(missing):
+                    vectors = vectors[:missing[0]]
+                    del self.metadata[self.index.ntotal + len(vectors):]
+                    rewrite_log = True
+                if len(vectors):
+                    faiss.normalize_L2(vectors)
+                    self.index.add(vectors)
+                    self._dirty = True
+            
+            # Map live memory IDs to their metadata position for O(1) lookups
+            self._id_to_pos = {record.id: i for i, record in enumerate(self.metadata)
+                               if record.id not in deleted_ids}
+            
+            if rewrite_log:
+                self._meta_fp = open(self._metadata_path, 'wb', buffering=65536)
+                for record in self.metadata:
+                    self._meta_fp.write(_json_dumps(self._record_to_log(record)) + b"\n")
+                    if record.id not in self._id_to_pos:
+                        self._meta_fp.write(_json_dumps({"id": record.id, "deleted": True}) + b"\n")
+            else:
+                self._meta_fp = open(self._metadata_path, 'ab', buffering=65536)
+            
+            # Update stats (deleted records stay in the index but are not counted)
+            self.stats["total_items"] = len(self._id_to_pos)
             self.stats["db_type"] = "faiss"
             
+            # Backend operations
+            self._add_impl = self._add_to_faiss
+            self._bulk_add_impl = self._bulk_add_each
+            self._search_impl = self._search_faiss
+            self._get_impl = self._get_faiss
+            self._delete_impl = self._delete_faiss
+            self._count_impl = lambda: len(self._id_to_pos) + len(self._pending_docs)
+            
+            # Persist any unsaved changes on shutdown
+            atexit.register(self.flush)
+            
+            # Finish lazy model setup before the first real query
+            self._warm_up_embeddings(self.embedding_model.encode)
+            
             self.logger.info(f"Initialized FAISS vector database with {self.stats['total_items']} items")
             
         except ImportError:
             self.logger.error("Failed to import faiss. Please install with: pip install faiss-cpu sentence-transformers")
             raise
     
+    @staticmethod
+    def _new_faiss_index(dimension: int):
+        """
+        Create an empty HNSW graph index (sublinear search, no training needed).
+        Embeddings are L2-normalized, so inner product is cosine similarity.
+        """
+        import faiss
+        
+        index = faiss.IndexHNSWFlat(dimension, 32, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = 80
+        return index
+    
+    def _map_embeddings(self, rows: int) -> None:
+        """
+        Map the embeddings file with room for at least the given number of rows,
+        growing it by doubling so appends rarely remap
+        
+        Args:
+            rows: Number of rows that must fit
+        """
+        import numpy as np
+        
+        row_bytes = self.index.d * 4
+        with open(self._embeddings_path, 'ab') as f:
+            capacity = f.tell() // row_bytes
+            if rows > capacity:
+                capacity = max(rows, capacity * 2, 1024)
+                f.truncate(capacity * row_bytes)
+        
+        self._embeddings = np.memmap(self._embeddings_path, dtype=np.float32, mode='r+',
+                                     shape=(capacity, self.index.d))
+    
+    def _warm_up_embeddings(self, embed) -> None:
+        """Run a throwaway embedding in a background thread"""
+        def run():
+            try:
+                embed(["warmup"])
+            except Exception as e:
+                self.logger.warning(f"Embedding model warm-up failed: {str(e)}")
+        
+        threading.Thread(target=run, daemon=True).start()
+    
     def _initialize_in_memory(self) -> None:
         """Initialize in-memory vector storage as fallback"""
         self.logger.warning("Using in-memory storage for long-term memory (not persistent)")
         
-        # Simple in-memory storage
+        # Simple in-memory storage with an inverted token index over title and content
         self.memories = []
+        self._token_index: Dict[str, set] = defaultdict(set)
         
         # Update stats
         self.stats["total_items"] = 0
         self.stats["db_type"] = "in-memory"
+        
+        # Backend operations
+        self._add_impl = self._add_to_memory
+        self._bulk_add_impl = self._bulk_add_each
+        self._search_impl = self._search_memory
+        self._get_impl = self._get_memory
+        self._delete_impl = self._delete_memory
+        self._count_impl = lambda: len(self.memories)
     
     def add(self, title: str, content: str, metadata: Dict[str, Any] = None) -> str:
         """
@@ -165,16 +368,11 @@ class LongTermMemory:
             metadata["timestamp"] = self.get_timestamp()
         
         try:
-            if self.stats.get("db_type") == "chroma":
-                self._add_to_chroma(memory_id, title, content, metadata)
-            elif self.stats.get("db_type") == "faiss":
-                self._add_to_faiss(memory_id, title, content, metadata)
-            else:
-                self._add_to_memory(memory_id, title, content, metadata)
+            self._add_impl(memory_id, title, content, metadata)
             
             # Update statistics
             self.stats["total_items"] += 1
-            self.stats["last_access"] = self.get_timestamp()
+            self._last_access_ns = time.time_ns()
             
             self.logger.debug(f"Added memory to long-term storage: {memory_id}")
             
@@ -184,74 +382,265 @@ class LongTermMemory:
             self.logger.error(f"Error adding to long-term memory: {str(e)}")
             # Fallback to in-memory if vector DB fails
             if self.stats.get("db_type") not in ["in-memory"]:
-                self.logger.info("Falling back to in-memory storage")
-                self._initialize_in_memory()
-                return self._add_to_memory(memory_id, title, content, metadata)
+                self._fall_back_to_memory([(memory_id, title, content, metadata)])
+                return memory_id
             raise
     
+    def bulk_add(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[str]:
+        """
+        Add several memories to long-term storage in one backend call
+        
+        Args:
+            items: (title, content, metadata) tuples; metadata may be None
+            
+        Returns:
+            Memory IDs in the same order as items
+        """
+        timestamp = self.get_timestamp()
+        records = []
+        for title, content, metadata in items:
+            if metadata is None:
+                metadata = {}
+            metadata.setdefault("timestamp", timestamp)
+            records.append((str(uuid.uuid4()), title, content, metadata))
+        
+        if not records:
+            return []
+        
+        memory_ids = [record[0] for record in records]
+        
+        try:
+            self._bulk_add_impl(records)
+            
+            # Update statistics
+            self.stats["total_items"] += len(records)
+            self._last_access_ns = time.time_ns()
+            
+            self.logger.debug(f"Added {len(records)} memories to long-term storage")
+            
+            return memory_ids
+            
+        except Exception as e:
+            self.logger.error(f"Error bulk adding to long-term memory: {str(e)}")
+            # Fallback to in-memory if vector DB fails
+            if self.stats.get("db_type") not in ["in-memory"]:
+                self._fall_back_to_memory(records)
+                return memory_ids
+            raise
+    
+    def _fall_back_to_memory(self, records: List[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+        """
+        Switch to in-memory storage after a backend failure, carrying over
+        queued FAISS adds as well as the records of the failed call
+        
+        Args:
+            records: (memory_id, title, content, metadata) tuples that were being added
+        """
+        self.logger.info("Falling back to in-memory storage")
+        
+        # Queued adds were already acknowledged to their callers; the failed
+        # call's records may be among them
+        with self._faiss_lock:
+            carried = [(record.id, record.title, record.content, record.metadata)
+                       for _, record, _ in self._pending_docs]
+            self._pending_docs = []
+        queued_ids = {record[0] for record in carried}
+        carried.extend(record for record in records if record[0] not in queued_ids)
+        
+        self._initialize_in_memory()
+        for record in carried:
+            self._add_to_memory(*record)
+        self.stats["total_items"] = len(self.memories)
+    
+    def _bulk_add_each(self, records: List[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+        """Add a batch of memories one at a time through the bound add operation"""
+        for record in records:
+            self._add_impl(*record)
+    
     def _add_to_chroma(self, memory_id: str, title: str, content: str, metadata: Dict[str, Any]) -> None:
         """Add memory to Chroma database"""
-        # Combine title and content for document
-        document = f"{title}\n\n{content}"
-        
-        # Add metadata fields
-        metadata_dict = {
-            "title": title,
-            "timestamp": metadata.get("timestamp", self.get_timestamp()),
-            **metadata
-        }
+        self._bulk_add_to_chroma([(memory_id, title, content, metadata)])
+    
+    def _bulk_add_to_chroma(self, records: List[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+        """Add a batch of memories to Chroma with a single collection.add"""
+        ids, documents, metadatas = [], [], []
+        for memory_id, title, content, metadata in records:
+            # Combine title and content for document
+            ids.append(memory_id)
+            documents.append(f"{title}\n\n{content}")
+            
+            # Add metadata fields
+            metadatas.append({
+                "title": title,
+                "timestamp": metadata.get("timestamp") or self.get_timestamp(),
+                **metadata
+            })
         
         # Add to collection
         self.collection.add(
-            ids=[memory_id],
-            documents=[document],
-            metadatas=[metadata_dict]
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas
         )
     
     def _add_to_faiss(self, memory_id: str, title: str, content: str, metadata: Dict[str, Any]) -> None:
-        """Add memory to FAISS database"""
-        import numpy as np
-        import pickle
-        import faiss
-        
+        """Queue memory for the FAISS database; it is embedded with the next batch"""
         # Combine title and content for embedding
         document = f"{title}\n\n{content}"
         
-        # Generate embedding
-        embedding = self.embedding_model.encode([document])[0]
-        embedding = np.array([embedding]).astype('float32')
+        record = MemoryRecord(
+            id=memory_id,
+            title=title,
+            content=content,
+            timestamp=metadata.get("timestamp") or self.get_timestamp(),
+            metadata=metadata
+        )
         
-        # Add to index
-        self.index.add(embedding)
+        # Serialize now so a value the log can't hold fails this add, not a later batch
+        line = _json_dumps(self._record_to_log(record)) + b"\n"
         
-        # Add metadata
-        metadata_dict = {
-            "id": memory_id,
-            "title": title,
-            "content": content,
-            "timestamp": metadata.get("timestamp", self.get_timestamp()),
-            **metadata
-        }
-        self.metadata.append(metadata_dict)
+        with self._faiss_lock:
+            self._pending_docs.append((document, record, line))
+            if len(self._pending_docs) >= self._pending_batch_size:
+                self.flush_pending()
+    
+    def flush_pending(self) -> None:
+        """Embed all queued FAISS documents in one batch and add them to the index"""
+        import numpy as np
         
-        # Save index and metadata
-        faiss.write_index(self.index, os.path.join(self.vector_db_path, "faiss_index.bin"))
-        with open(os.path.join(self.vector_db_path, "faiss_metadata.pkl"), 'wb') as f:
-            pickle.dump(self.metadata, f)
+        with self._faiss_lock:
+            if not self._pending_docs:
+                return
+            
+            # Queued items stay queued until the index and metadata both hold them,
+            # so a failure here leaves them to be retried instead of lost
+            pending = self._pending_docs[:]
+            
+            # Generate embeddings for the whole batch and add them in a single call
+            embeddings = self.embedding_model.encode(
+                [document for document, _, _ in pending],
+                batch_size=32,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ).astype(np.float32, copy=False)
+            
+            # Store the vectors before logging their metadata so every logged record has one
+            start = len(self.metadata)
+            if start + len(pending) > self._embeddings.shape[0]:
+                self._map_embeddings(start + len(pending))
+            self._embeddings[start:start + len(pending)] = embeddings
+            
+            # Nothing after the index add can fail before metadata catches up with it
+            self.index.add(embeddings)
+            for _, record, _ in pending:
+                self._id_to_pos[record.id] = start
+                self.metadata.append(record)
+                start += 1
+            del self._pending_docs[:len(pending)]
+            
+            # Their vectors are already in the memmap, so once the log lines reach
+            # the OS a restart recovers these records even without an index save
+            self._meta_fp.write(b"".join(line for _, _, line in pending))
+            self._meta_fp.flush()
+            
+            # Save index and metadata once enough changes have accumulated
+            self._mark_dirty(len(pending))
+    
+    def _mark_dirty(self, changes: int = 1) -> None:
+        """Record unsaved FAISS changes and save if the batch is full"""
+        self._dirty = True
+        self._adds_since_flush += changes
+        if self._adds_since_flush >= self._flush_threshold:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write the FAISS index and metadata to disk if they have unsaved changes"""
+        if self.stats.get("db_type") != "faiss":
+            return
+        
+        with self._faiss_lock:
+            self.flush_pending()
+            if not self._dirty:
+                return
+            
+            import faiss
+            
+            try:
+                # Embeddings and metadata go first so the log never has fewer records than the index
+                self._embeddings.flush()
+                self._meta_fp.flush()
+                faiss.write_index(self.index, os.path.join(self.vector_db_path, "faiss_index.bin"))
+                
+                self._dirty = False
+                self._adds_since_flush = 0
+            except Exception as e:
+                self.logger.error(f"Error saving FAISS index: {str(e)}")
+    
+    def _replay_metadata_log(self) -> Tuple[List[MemoryRecord], set]:
+        """Rebuild the FAISS metadata list and the set of deleted IDs from the append-only log"""
+        metadata = []
+        deleted_ids = set()
+        
+        with open(self._metadata_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = _json_loads(line)
+                
+                # Tombstones carry only the ID and the deleted flag; older
+                # logs also flagged full records
+                if item.get("deleted"):
+                    deleted_ids.add(item["id"])
+                    if "title" not in item:
+                        continue
+                
+                metadata.append(self._record_from_log(item))
+        
+        return metadata, deleted_ids
+    
+    @staticmethod
+    def _record_to_log(record: MemoryRecord) -> Dict[str, Any]:
+        """Flatten a record into the log format (fields plus metadata keys)"""
+        return {
+            "id": record.id,
+            "title": record.title,
+            "content": record.content,
+            "timestamp": record.timestamp,
+            **record.metadata
+        }
+    
+    @staticmethod
+    def _record_from_log(item: Dict[str, Any]) -> MemoryRecord:
+        """Build a record from a flattened log entry"""
+        metadata = {key: value for key, value in item.items()
+                    if key not in ("id", "title", "content", "deleted")}
+        return MemoryRecord(
+            id=item["id"],
+            title=item["title"],
+            content=item.get("content", ""),
+            timestamp=item.get("timestamp", ""),
+            metadata=metadata
+        )
     
     def _add_to_memory(self, memory_id: str, title: str, content: str, metadata: Dict[str, Any]) -> str:
         """Add to in-memory storage"""
-        memory_item = {
-            "id": memory_id,
-            "title": title,
-            "content": content,
-            "timestamp": metadata.get("timestamp", self.get_timestamp()),
-            "metadata": metadata
-        }
+        record = MemoryRecord(
+            id=memory_id,
+            title=title,
+            content=content,
+            timestamp=metadata.get("timestamp") or self.get_timestamp(),
+            metadata=metadata
+        )
         
-        self.memories.append(memory_item)
+        self.memories.append(record)
+        self._index_memory(len(self.memories) - 1, record)
         return memory_id
     
+    def _index_memory(self, position: int, record: MemoryRecord) -> None:
+        """Add an in-memory record's title and content tokens to the inverted index"""
+        for token in set(re.findall(r"\w+", f"{record.title} {record.content}".lower())):
+            self._token_index[token].add(position)
+    
     def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Search for memories semantically related to the query
@@ -264,15 +653,10 @@ class LongTermMemory:
             List of matching memory items
         """
         try:
-            self.stats["last_access"] = self.get_timestamp()
+            self._last_access_ns = time.time_ns()
+            
+            return self._search_impl(query, limit)
             
-            if self.stats.get("db_type") == "chroma":
-                return self._search_chroma(query, limit)
-            elif self.stats.get("db_type") == "faiss":
-                return self._search_faiss(query, limit)
-            else:
-                return self._search_memory(query, limit)
-                
         except Exception as e:
             self.logger.error(f"Error searching long-term memory: {str(e)}")
             return []
@@ -300,44 +684,60 @@ class LongTermMemory:
         """Search in FAISS database"""
         import numpy as np
         
-        # Generate query embedding
-        query_embedding = self.embedding_model.encode([query])[0]
-        query_embedding = np.array([query_embedding]).astype('float32')
-        
-        # Search index
-        k = min(limit, self.index.ntotal)
-        if k == 0:
-            return []
+        # Make queued memories searchable
+        self.flush_pending()
+        
+        # Generate query embedding as a (1, d) float32 array FAISS can take as-is
+        query_embedding = self.embedding_model.encode(
+            [query],
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        ).astype(np.float32, copy=False)
+        
+        # Search index and resolve positions against the same metadata snapshot
+        with self._faiss_lock:
+            k = min(limit, self.index.ntotal)
+            if k == 0:
+                return []
+                
+            similarities, indices = self.index.search(query_embedding, k)
             
-        distances, indices = self.index.search(query_embedding, k)
-        
-        # Format results
-        results = []
-        for i, idx in enumerate(indices[0]):
-            if idx < len(self.metadata):
-                metadata = self.metadata[idx]
-                results.append({
-                    "id": metadata["id"],
-                    "title": metadata["title"],
-                    "content": metadata["content"],
-                    "metadata": metadata,
-                    "distance": float(distances[0][i])
-                })
+            # Format results
+            results = []
+            for i, idx in enumerate(indices[0]):
+                if 0 <= idx < len(self.metadata) and self.metadata[idx].id in self._id_to_pos:
+                    record = self.metadata[idx]
+                    results.append({
+                        "id": record.id,
+                        "title": record.title,
+                        "content": record.content,
+                        "metadata": record.metadata,
+                        # Report cosine distance so smaller still means closer
+                        "distance": 1.0 - float(similarities[0][i])
+                    })
         
         return results
     
     def _search_memory(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """Search in in-memory storage"""
-        # Simple string matching for in-memory
         query = query.lower()
+        tokens = set(re.findall(r"\w+", query))
+        
+        # Intersect token postings, rarest first, keeping insertion order
+        if len(query) > 1 and tokens:
+            postings = sorted((self._token_index.get(token, set()) for token in tokens), key=len)
+            positions = set(postings[0]).intersection(*postings[1:])
+            return [self.memories[i].to_dict() for i in sorted(positions)[:limit]]
+        
+        # Simple string matching for single-character and symbol-only queries
         results = []
         
-        for item in self.memories:
-            title = item["title"].lower()
-            content = item["content"].lower()
+        for record in self.memories:
+            title = record.title.lower()
+            content = record.content.lower()
             
             if query in title or query in content:
-                results.append(item)
+                results.append(record.to_dict())
                 
                 if len(results) >= limit:
                     break
@@ -355,30 +755,10 @@ class LongTermMemory:
             Memory item or None if not found
         """
         try:
-            self.stats["last_access"] = self.get_timestamp()
-            
-            if self.stats.get("db_type") == "chroma":
-                results = self.collection.get(ids=[memory_id])
-                if results["ids"]:
-                    return {
-                        "id": results["ids"][0],
-                        "content": results["documents"][0],
-                        "metadata": results["metadatas"][0]
-                    }
-                return None
-                
-            elif self.stats.get("db_type") == "faiss":
-                for item in self.metadata:
-                    if item["id"] == memory_id:
-                        return item
-                return None
-                
-            else:
-                for item in self.memories:
-                    if item["id"] == memory_id:
-                        return item
-                return None
-                
+            self._last_access_ns = time.time_ns()
+            
+            return self._get_impl(memory_id)
+            
         except Exception as e:
             self.logger.error(f"Error retrieving memory {memory_id}: {str(e)}")
             return None
@@ -394,36 +774,73 @@ class LongTermMemory:
             True if successful, False otherwise
         """
         try:
-            if self.stats.get("db_type") == "chroma":
-                self.collection.delete(ids=[memory_id])
-                self.stats["total_items"] = self.collection.count()
-                return True
-                
-            elif self.stats.get("db_type") == "faiss":
-                # FAISS doesn't support direct deletion
-                # We would need to rebuild the index, which is complex
-                # For now, just mark as deleted in metadata
-                for i, item in enumerate(self.metadata):
-                    if item["id"] == memory_id:
-                        self.metadata[i]["deleted"] = True
-                        
-                        # Save updated metadata
-                        with open(os.path.join(self.vector_db_path, "faiss_metadata.pkl"), 'wb') as f:
-                            import pickle
-                            pickle.dump(self.metadata, f)
-                        
-                        return True
-                return False
-                
-            else:
-                self.memories = [item for item in self.memories if item["id"] != memory_id]
-                self.stats["total_items"] = len(self.memories)
-                return True
-                
+            return self._delete_impl(memory_id)
+            
         except Exception as e:
             self.logger.error(f"Error deleting memory {memory_id}: {str(e)}")
             return False
     
+    def _get_chroma(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a memory from Chroma database"""
+        results = self.collection.get(ids=[memory_id])
+        if results["ids"]:
+            return {
+                "id": results["ids"][0],
+                "content": results["documents"][0],
+                "metadata": results["metadatas"][0]
+            }
+        return None
+    
+    def _get_faiss(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a memory from FAISS metadata"""
+        with self._faiss_lock:
+            self.flush_pending()
+            pos = self._id_to_pos.get(memory_id)
+            return self.metadata[pos].to_dict() if pos is not None else None
+    
+    def _get_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a memory from in-memory storage"""
+        for record in self.memories:
+            if record.id == memory_id:
+                return record.to_dict()
+        return None
+    
+    def _delete_chroma(self, memory_id: str) -> bool:
+        """Delete a memory from Chroma database"""
+        self.collection.delete(ids=[memory_id])
+        self.stats["total_items"] = self.collection.count()
+        return True
+    
+    def _delete_faiss(self, memory_id: str) -> bool:
+        """Mark a memory as deleted in FAISS metadata"""
+        # FAISS doesn't support direct deletion
+        # We would need to rebuild the index, which is complex
+        # For now, just mark as deleted in metadata
+        with self._faiss_lock:
+            self.flush_pending()
+            pos = self._id_to_pos.pop(memory_id, None)
+            if pos is None:
+                return False
+            
+            self._meta_fp.write(_json_dumps({"id": memory_id, "deleted": True}) + b"\n")
+            self.stats["total_items"] -= 1
+            
+            # Save updated metadata with the next batch
+            self._mark_dirty()
+        
+        return True
+    
+    def _delete_memory(self, memory_id: str) -> bool:
+        """Delete a memory from in-memory storage"""
+        self.memories = [record for record in self.memories if record.id != memory_id]
+        self.stats["total_items"] = len(self.memories)
+        
+        # Positions shifted, so rebuild the token index
+        self._token_index = defaultdict(set)
+        for i, record in enumerate(self.memories):
+            self._index_memory(i, record)
+        return True
+    
     def get_stats(self) -> Dict[str, Any]:
         """
         Get memory statistics
@@ -431,16 +848,21 @@ class LongTermMemory:
         Returns:
             Dictionary of memory statistics
         """
-        # Update total items count
-        if self.stats.get("db_type") == "chroma":
-            self.stats["total_items"] = self.collection.count()
-        elif self.stats.get("db_type") == "faiss":
-            self.stats["total_items"] = self.index.ntotal
-        else:
-            self.stats["total_items"] = len(self.memories)
+        # total_items is kept current by add/delete; only the access time needs formatting
+        self.stats["last_access"] = datetime.datetime.fromtimestamp(self._last_access_ns / 1e9).isoformat()
         
         return dict(self.stats)
     
+    def refresh_counts(self) -> int:
+        """
+        Recount stored items from the backend, reconciling the tracked total
+        
+        Returns:
+            Current number of stored items
+        """
+        self.stats["total_items"] = self._count_impl()
+        return self.stats["total_items"]
+    
     @staticmethod
     def get_timestamp() -> str:
         """
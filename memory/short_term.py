@@ -3,13 +3,113 @@ Short-Term Memory - RAM-like memory system for the AGI
 Stores recent interactions, context, and temporary information
 """
 
+import sys
 import time
 import logging
-import json
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 from collections import deque, defaultdict
+from itertools import islice
 import datetime
 
+from memory._short_term_fast import tokenize, search_text, trigram_bloom, field_pairs
+
+def str_id(key: Tuple[str, int]) -> str:
+    """Public string form of a (memory_type, stamp) key"""
+    return f"{key[0]}_{key[1]}"
+
+class MemoryItem:
+    """
+    A short-term memory entry. Public methods hand out to_dict() copies,
+    so instances stay private and can be recycled after eviction.
+    """
+    
+    __slots__ = ("key", "id", "type", "data", "created_at", "tokens", "fields", "search_blob", "search_bloom")
+    
+    def __init__(self, key: Tuple[str, int], data: Dict[str, Any], created_at: str,
+                 tokens: set, fields: tuple):
+        self.reset(key, data, created_at, tokens, fields)
+    
+    def reset(self, key: Tuple[str, int], data: Dict[str, Any], created_at: str,
+              tokens: set, fields: tuple) -> "MemoryItem":
+        """Overwrite every field, returning the item for reuse"""
+        self.key = key
+        self.id = str_id(key)
+        self.type = key[0]
+        self.data = data
+        self.created_at = created_at
+        self.tokens = tokens
+        self.fields = fields
+        self.search_blob = None
+        self.search_bloom = 0
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Public dictionary form of the item"""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "data": self.data,
+            "created_at": self.created_at
+        }
+
+class RingBuffer:
+    """
+    Fixed-capacity circular buffer over a preallocated list.
+    Appending to a full buffer overwrites the oldest item and returns it.
+    Not thread-safe; ShortTermMemory only touches it under its lock.
+    """
+    
+    __slots__ = ("buf", "head", "size", "cap")
+    
+    def __init__(self, capacity: int):
+        self.buf = [None] * capacity
+        self.head = 0
+        self.size = 0
+        self.cap = capacity
+    
+    def append(self, item: Any) -> Any:
+        """
+        Add an item at the newest end
+        
+        Args:
+            item: Item to store
+            
+        Returns:
+            The evicted oldest item, or None if there was room
+        """
+        if self.size < self.cap:
+            self.buf[(self.head + self.size) % self.cap] = item
+            self.size += 1
+            return None
+        
+        evicted = self.buf[self.head]
+        self.buf[self.head] = item
+        self.head = (self.head + 1) % self.cap
+        return evicted
+    
+    def clear(self) -> None:
+        """Drop all items, keeping the preallocated slots"""
+        for i in range(self.cap):
+            self.buf[i] = None
+        self.head = 0
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self):
+        """Iterate oldest to newest"""
+        buf, head, cap = self.buf, self.head, self.cap
+        for i in range(self.size):
+            yield buf[(head + i) % cap]
+    
+    def __reversed__(self):
+        """Iterate newest to oldest"""
+        buf, head, cap = self.buf, self.head, self.cap
+        for i in range(self.size - 1, -1, -1):
+            yield buf[(head + i) % cap]
+
 class ShortTermMemory:
     """
     Short-term memory system for the Hohenheim AGI.
@@ -27,16 +127,38 @@ class ShortTermMemory:
         self.config = config_manager
         self.logger = logging.getLogger("Hohenheim.ShortTermMemory")
         
-        # Memory storage - organized by type
-        self.memories = defaultdict(lambda: deque(maxlen=max_size))
+        # Memory storage - organized by type, one ring buffer per type
+        self.memories = defaultdict(lambda: RingBuffer(max_size))
         
         # Global memory queue for chronological access
         self.memory_timeline = deque(maxlen=max_size)
         
+        # (memory_type, stamp) -> item for every item still held in its type queue
+        self._by_id: Dict[Tuple[str, int], MemoryItem] = {}
+        self._last_id_stamp = 0
+        
+        # Last formatted timestamp and the millisecond it belongs to
+        self._iso_ms = -1
+        self._iso = ""
+        
+        # Inverted index: token -> IDs of items whose data contains it (each
+        # item keeps its own tokens so eviction can undo its postings)
+        self._inverted: Dict[str, set] = defaultdict(set)
+        
+        # Field index for "field:value" queries: field -> exact value -> IDs
+        self._field_index: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+        
+        # Evicted items are recycled by add() instead of allocating new ones
+        self._pool: deque = deque(maxlen=256)
+        
+        # One lock for all of the above: ring buffers, the ID stamp and the indexes
+        # are updated in several steps, and pooled items are reset in place
+        self._lock = threading.Lock()
+        
         # Memory statistics
         self.stats = {
             "total_items": 0,
-            "items_by_type": defaultdict(int),
+            "items_by_type": {},
             "created_at": self.get_timestamp()
         }
         
@@ -53,34 +175,111 @@ class ShortTermMemory:
         Returns:
             Memory ID
         """
-        # Generate a memory ID
-        memory_id = f"{memory_type}_{int(time.time() * 1000)}"
-        
-        # Ensure timestamp exists
-        if "timestamp" not in data:
-            data["timestamp"] = self.get_timestamp()
-        
-        # Create memory item
-        memory_item = {
-            "id": memory_id,
-            "type": memory_type,
-            "data": data,
-            "created_at": self.get_timestamp()
-        }
-        
-        # Add to type-specific queue
-        self.memories[memory_type].append(memory_item)
-        
-        # Add to timeline
-        self.memory_timeline.append(memory_item)
+        return self.add_many([(memory_type, data)])[0]
+    
+    def add_many(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Add several items to short-term memory in one pass
         
-        # Update statistics
-        self.stats["total_items"] += 1
-        self.stats["items_by_type"][memory_type] += 1
+        Args:
+            items: (memory_type, data) pairs, oldest first
+            
+        Returns:
+            Memory IDs in the same order as items
+        """
+        with self._lock:
+            # Read the clock once for the whole batch. IDs key the lookup index,
+            # so keep them unique even if the clock repeats a value.
+            now_ns = time.time_ns()
+            now_iso = self._timestamp_at(now_ns)
+            stamp = max(now_ns, self._last_id_stamp + 1)
+            
+            memories = self.memories
+            timeline = self.memory_timeline
+            by_id = self._by_id
+            inverted = self._inverted
+            field_index = self._field_index
+            pool = self._pool
+            counts = self.stats["items_by_type"]
+            unindex = self._unindex
+            memory_ids = []
+            
+            for memory_type, data in items:
+                # Intern the type so the buffer, stats and key lookups below
+                # compare it by identity
+                memory_type = sys.intern(memory_type)
+                key = (memory_type, stamp)
+                stamp += 1
+                
+                # Ensure timestamp exists
+                data.setdefault("timestamp", now_iso)
+                
+                # Create memory item, reusing an evicted one when available
+                tokens = tokenize(data)
+                fields = field_pairs(data)
+                if pool:
+                    memory_item = pool.pop().reset(key, data, now_iso, tokens, fields)
+                else:
+                    memory_item = MemoryItem(key, data, now_iso, tokens, fields)
+                memory_id = memory_item.id
+                
+                # Add to type-specific buffer, dropping the evicted item from the indexes
+                buffer = memories[memory_type]
+                evicted = buffer.append(memory_item)
+                if evicted is not None:
+                    unindex(evicted)
+                by_id[key] = memory_item
+                
+                for token in tokens:
+                    inverted[token].add(memory_id)
+                for field, value in fields:
+                    field_index[field][value].add(memory_id)
+                
+                # Add to timeline
+                timeline.append(memory_item)
+                
+                # An item evicted from its type buffer has now left the timeline too
+                if evicted is not None:
+                    pool.append(evicted)
+                
+                counts[memory_type] = len(buffer)
+                memory_ids.append(memory_id)
+            
+            self._last_id_stamp = stamp - 1
+            self.stats["total_items"] = len(timeline)
         
-        self.logger.debug(f"Added memory item: {memory_id} of type {memory_type}")
+        # Hot path: skip formatting entirely unless debug logging is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Added %d memory items: %s", len(memory_ids), ", ".join(memory_ids))
         
-        return memory_id
+        return memory_ids
+    
+    def _timestamp_at(self, now_ns: int) -> str:
+        """Format a time_ns value as ISO, reusing the result within the same millisecond"""
+        ms = now_ns // 1_000_000
+        if ms != self._iso_ms:
+            self._iso_ms = ms
+            self._iso = datetime.datetime.fromtimestamp(now_ns / 1e9).isoformat()
+        return self._iso
+    
+    def _unindex(self, item: MemoryItem) -> None:
+        """Remove an item from the ID and token indexes"""
+        self._by_id.pop(item.key, None)
+        for token in item.tokens:
+            postings = self._inverted.get(token)
+            if postings is not None:
+                postings.discard(item.id)
+                if not postings:
+                    del self._inverted[token]
+        for field, value in item.fields:
+            values = self._field_index.get(field)
+            if values is None or value not in values:
+                continue
+            values[value].discard(item.id)
+            if not values[value]:
+                del values[value]
+                if not values:
+                    del self._field_index[field]
     
     def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -92,19 +291,22 @@ class ShortTermMemory:
         Returns:
             Memory item or None if not found
         """
-        # Extract memory type from ID
-        if "_" not in memory_id:
-            self.logger.warning(f"Invalid memory ID format: {memory_id}")
+        # IDs are "<type>_<stamp>"; one rpartition both validates and splits,
+        # and takes the last underscore since types like "system_event" have their own
+        memory_type, sep, stamp = memory_id.rpartition("_")
+        if not sep or not stamp.isdecimal():
+            if self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning("Invalid memory ID format: %s", memory_id)
             return None
-            
-        memory_type = memory_id.split("_")[0]
         
-        # Search in the specific memory type queue
-        for item in self.memories[memory_type]:
-            if item["id"] == memory_id:
-                return item
+        # Copy under the lock, since an evicted item may be recycled by add()
+        with self._lock:
+            item = self._by_id.get((memory_type, int(stamp)))
+            if item is not None:
+                return item.to_dict()
         
-        self.logger.warning(f"Memory item not found: {memory_id}")
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("Memory item not found: %s", memory_id)
         return None
     
     def get_by_type(self, memory_type: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -118,10 +320,14 @@ class ShortTermMemory:
         Returns:
             List of memory items
         """
-        items = list(self.memories[memory_type])
-        
-        # Return most recent items first
-        return items[-limit:][::-1]
+        # Unknown types have no buffer; don't allocate one just to read it
+        with self._lock:
+            items = self.memories.get(memory_type)
+            if items is None:
+                return []
+            
+            # Return most recent items first, materializing only those returned
+            return [item.to_dict() for item in islice(reversed(items), limit)]
     
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -133,10 +339,10 @@ class ShortTermMemory:
         Returns:
             List of recent memory items
         """
-        items = list(self.memory_timeline)
-        
-        # Return most recent items first
-        return items[-limit:][::-1]
+        # Return most recent items first, materializing only those returned; the
+        # lock keeps add() from mutating the deque while it is walked
+        with self._lock:
+            return [item.to_dict() for item in islice(reversed(self.memory_timeline), limit)]
     
     def search(self, query: str, memory_type: str = None, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -148,30 +354,89 @@ class ShortTermMemory:
             limit: Maximum number of results
             
         Returns:
-            List of matching memory items
+            List of matching memory items, most recent first
         """
+        # Hold the lock while walking the live buffers and indexes
+        with self._lock:
+            return self._search_locked(query.lower(), memory_type, limit)
+    
+    def _search_locked(self, query: str, memory_type: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Search body for search(); the caller holds the lock and lowercases the query"""
         results = []
-        query = query.lower()
         
-        # Determine which memories to search
+        # Determine which memories to search, newest first so the first
+        # limit hits are the most recent ones (iterated in place, not copied)
         if memory_type:
-            memories_to_search = list(self.memories[memory_type])
+            memories_to_search = reversed(self.memories.get(memory_type, ()))
         else:
-            memories_to_search = list(self.memory_timeline)
+            memories_to_search = reversed(self.memory_timeline)
         
-        # Simple string matching search
+        # "field:value" queries try the field index first, falling back to a
+        # plain search of the whole query when nothing matches exactly
+        field, sep, value = query.partition(":")
+        if sep:
+            values = self._field_index.get(field.strip())
+            candidates = values.get(value.strip()) if values is not None else None
+            if candidates:
+                return self._collect(memories_to_search, candidates, limit)
+        
+        # Intersect token postings, rarest first, then collect matches newest first
+        tokens = tokenize(query)
+        if tokens:
+            postings = sorted((self._inverted.get(token, set()) for token in tokens), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            if not candidates:
+                return results
+            
+            return self._collect(memories_to_search, candidates, limit)
+        
+        # Simple string matching for queries without word characters, done
+        # with bytes.find over each item's cached leaf text (keys and JSON
+        # punctuation are not part of it). A trigram Bloom filter skips most
+        # non-matching items before the scan.
+        query_bytes = query.encode("utf-8")
+        query_bloom = trigram_bloom(query_bytes)
         for item in memories_to_search:
-            # Convert data to string for searching
-            item_str = json.dumps(item["data"]).lower()
+            # Build each item's search text and filter only once
+            blob = item.search_blob
+            if blob is None:
+                blob = item.search_blob = search_text(item.data)
+                item.search_bloom = trigram_bloom(blob)
             
-            if query in item_str:
-                results.append(item)
+            if item.search_bloom & query_bloom != query_bloom:
+                continue
+            
+            if blob.find(query_bytes) != -1:
+                results.append(item.to_dict())
                 
                 if len(results) >= limit:
                     break
         
         return results
     
+    @staticmethod
+    def _collect(memories, candidates: set, limit: int) -> List[Dict[str, Any]]:
+        """
+        Pick the items whose IDs are candidates, in iteration order
+        
+        Args:
+            memories: Items to walk
+            candidates: Matching memory IDs
+            limit: Maximum number of results
+            
+        Returns:
+            Matching items as dictionaries
+        """
+        results = []
+        for item in memories:
+            if item.id in candidates:
+                results.append(item.to_dict())
+                
+                if len(results) >= limit or len(results) == len(candidates):
+                    break
+        
+        return results
+    
     def clear(self, memory_type: str = None) -> None:
         """
         Clear memories
@@ -179,27 +444,37 @@ class ShortTermMemory:
         Args:
             memory_type: Type of memories to clear, or None for all
         """
-        if memory_type:
-            self.logger.info(f"Clearing memories of type: {memory_type}")
-            self.memories[memory_type].clear()
-            
-            # Update timeline to remove cleared items
-            self.memory_timeline = deque(
-                [item for item in self.memory_timeline if item["type"] != memory_type],
-                maxlen=self.memory_timeline.maxlen
-            )
-            
-            # Update statistics
-            self.stats["total_items"] -= self.stats["items_by_type"][memory_type]
-            self.stats["items_by_type"][memory_type] = 0
-        else:
-            self.logger.info("Clearing all short-term memories")
-            self.memories.clear()
-            self.memory_timeline.clear()
-            
-            # Reset statistics
-            self.stats["total_items"] = 0
-            self.stats["items_by_type"] = defaultdict(int)
+        with self._lock:
+            if memory_type:
+                self.logger.info("Clearing memories of type: %s", memory_type)
+                buffer = self.memories.get(memory_type)
+                if buffer is None:
+                    return
+                for item in buffer:
+                    self._unindex(item)
+                buffer.clear()
+                
+                # Filter cleared items out of the timeline in place, keeping order
+                timeline = self.memory_timeline
+                for _ in range(len(timeline)):
+                    item = timeline.popleft()
+                    if item.type != memory_type:
+                        timeline.append(item)
+                
+                # Update statistics
+                self.stats["total_items"] = len(self.memory_timeline)
+                self.stats["items_by_type"].pop(memory_type, None)
+            else:
+                self.logger.info("Clearing all short-term memories")
+                self.memories.clear()
+                self.memory_timeline.clear()
+                self._by_id.clear()
+                self._inverted.clear()
+                self._field_index.clear()
+                
+                # Reset statistics
+                self.stats["total_items"] = 0
+                self.stats["items_by_type"] = {}
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -208,12 +483,11 @@ class ShortTermMemory:
         Returns:
             Dictionary of memory statistics
         """
-        # Update stats with current counts
-        self.stats["total_items"] = len(self.memory_timeline)
-        for memory_type in self.memories:
-            self.stats["items_by_type"][memory_type] = len(self.memories[memory_type])
-        
-        return dict(self.stats)
+        # Counts are kept current by add() and clear(); copy so callers can't mutate them
+        with self._lock:
+            stats = dict(self.stats)
+            stats["items_by_type"] = dict(self.stats["items_by_type"])
+        return stats
     
     @staticmethod
     def get_timestamp() -> str: